@@ -2,8 +2,8 @@
 
 
 a = Analysis(
-    ['adtui/adtui.py'],
-    pathex=[],
+    ['scripts/adtui_entry.py'],
+    pathex=[SPECPATH],  # so the entry script can import the adtui package
     binaries=[],
     datas=[('adtui/styles.tcss', 'adtui'), ('config.ini.example', '.')],
     hiddenimports=[],
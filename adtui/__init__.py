@@ -15,6 +15,15 @@ except ImportError:
 __author__ = "Brz"
 __email__ = "brz@brznet.fr"
 
-from .adtui import ADTUI, main
+from .cli import main
 
 __all__ = ["ADTUI", "main", "__version__"]
+
+
+def __getattr__(name):
+    # The app pulls in Textual and ldap3; only load it when asked for
+    if name == "ADTUI":
+        from .adtui import ADTUI
+
+        return ADTUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,6 @@
 """Module entry point for 'python -m adtui'."""
 
-from .adtui import main
+from .cli import main
 
 if __name__ == "__main__":
     main()
@@ -2,10 +2,12 @@
 
 import logging
 import threading
-from typing import Optional, Dict, Set, List, Any
+from functools import partial
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from ldap3 import Connection
 from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
 
 try:
     from .services.connection_manager import ConnectionManager
@@ -22,6 +24,13 @@ class ADTree(Tree):
         self.base_dn = base_dn
         self.loaded_ous = set()  # Track which OUs have been populated
         self.ou_cache = {}  # Cache for OU contents
+        # Per-parent child lookups keyed by parent node id
+        self._child_by_ou: Dict[int, Dict[str, TreeNode]] = {}
+        self._child_by_dn: Dict[int, Dict[str, TreeNode]] = {}
+        # Every node in the tree keyed by lowercased DN
+        self._node_by_dn: Dict[str, TreeNode] = {}
+        # objectClass values (lowercased) of the loaded objects, same keys
+        self._object_classes: Dict[str, FrozenSet[str]] = {}
         self.build_tree()
 
     def build_tree(self):
@@ -29,71 +38,147 @@ class ADTree(Tree):
         if self.connection_manager is None:
             return
         try:
-            # Clear existing tree nodes
-            self.root.remove_children()
+            self._show_tree(self._fetch_direct_children(self.base_dn))
+        except Exception as e:
+            import traceback
 
-            # Start with base DN as root
-            root_node = self.root.add(f"📁 {self.base_dn}", expand=True)
-            self._build_direct_children(root_node, self.base_dn)
+            traceback.print_exc()
 
-            # Ensure tree root is expanded to show base DN node
-            self.root.expand()
+    def build_tree_in_background(self):
+        """Rebuild the tree, running the LDAP search off the UI thread."""
+        if self.connection_manager is None:
+            return
+        self.run_worker(
+            self._build_tree_worker, thread=True, group="build-tree", exclusive=True
+        )
+
+    def _build_tree_worker(self):
+        """Fetch the base DN's children and hand them to the UI thread."""
+        try:
+            children = self._fetch_direct_children(self.base_dn)
         except Exception as e:
             import traceback
 
             traceback.print_exc()
+            return
+        self.app.call_from_thread(self._show_tree, children)
+
+    def _show_tree(self, children: List[Tuple[str, str]]):
+        """Replace the tree with the base DN node and its direct children."""
+        # Clear existing tree nodes
+        self.root.remove_children()
+        self._child_by_ou.clear()
+        self._child_by_dn.clear()
+        self._node_by_dn.clear()
+        self._object_classes.clear()
+        # None of the new nodes have their contents loaded yet
+        self.loaded_ous.clear()
+
+        # Start with base DN as root
+        root_node = self.root.add(f"📁 {self.base_dn}", expand=True)
+        self._node_by_dn[self.base_dn.lower()] = root_node
+        self._add_ou_children(root_node, children)
+
+        # Ensure tree root is expanded to show base DN node
+        self.root.expand()
 
     def load_root(self):
         """Load root of tree (alias for build_tree)."""
         self.build_tree()
 
-    def _build_direct_children(self, parent_node, parent_dn):
-        """Build only the direct children of an OU or container."""
-        try:
+    def _fetch_direct_children(self, parent_dn) -> List[Tuple[str, str]]:
+        """Search the direct child OUs and containers of a DN.
 
-            def search_op(conn: Connection):
-                # Search for direct child OUs and containers (Builtin, Users, Computers, etc.)
-                conn.search(
-                    parent_dn,
-                    "(|(objectClass=organizationalUnit)(objectClass=container))",
-                    attributes=["ou", "cn", "distinguishedName", "objectClass"],
-                    search_scope="LEVEL",
-                    size_limit=1000,
-                )
-
-                # Sort alphabetically by name (ou for OUs, cn for containers)
-                def get_name(entry):
+        Returns:
+            List of (name, dn) tuples sorted by name
+        """
+
+        def search_op(conn: Connection):
+            # Search for direct child OUs and containers (Builtin, Users, Computers, etc.)
+            conn.search(
+                parent_dn,
+                "(|(objectClass=organizationalUnit)(objectClass=container))",
+                attributes=["ou", "cn", "distinguishedName", "objectClass"],
+                search_scope="LEVEL",
+                size_limit=1000,
+            )
+
+            # Sort alphabetically by name (ou for OUs, cn for containers)
+            def get_name(entry):
+                if "ou" in entry and entry["ou"].value:
+                    return str(entry["ou"]).lower()
+                elif "cn" in entry and entry["cn"].value:
+                    return str(entry["cn"]).lower()
+                return ""
+
+            entries = sorted(conn.entries, key=get_name)
+
+            children = []
+            for entry in entries:
+                entry_dn = entry.entry_dn
+                if self._is_direct_child(entry_dn, parent_dn):
+                    # Get name from ou (for OUs) or cn (for containers)
                     if "ou" in entry and entry["ou"].value:
-                        return str(entry["ou"]).lower()
+                        name = str(entry["ou"])
                     elif "cn" in entry and entry["cn"].value:
-                        return str(entry["cn"]).lower()
-                    return ""
-
-                entries = sorted(conn.entries, key=get_name)
-
-                for entry in entries:
-                    entry_dn = entry.entry_dn
-                    if self._is_direct_child(entry_dn, parent_dn):
-                        # Get name from ou (for OUs) or cn (for containers)
-                        if "ou" in entry and entry["ou"].value:
-                            name = str(entry["ou"])
-                        elif "cn" in entry and entry["cn"].value:
-                            name = str(entry["cn"])
-                        else:
-                            name = "Unknown"
-
-                        node = parent_node.add(f"📁 {name}", expand=False)
-                        node.data = entry_dn
-
-            if self.connection_manager:
-                self.connection_manager.execute_with_retry(search_op)
-            else:
-                return
+                        name = str(entry["cn"])
+                    else:
+                        name = "Unknown"
+                    children.append((name, entry_dn))
+            return children
+
+        return self.connection_manager.execute_with_retry(search_op)
+
+    def _add_ou_children(self, parent_node, children: List[Tuple[str, str]]):
+        """Add OU/container nodes under a parent node."""
+        for name, entry_dn in children:
+            node = parent_node.add(f"📁 {name}", expand=False)
+            node.data = entry_dn
+            self._index_child(parent_node, node, name)
+
+    def _index_child(self, parent_node, node, ou_name: Optional[str] = None):
+        """Record a newly added child in the parent's lookup indexes."""
+        if ou_name is not None:
+            self._child_by_ou.setdefault(parent_node.id, {}).setdefault(
+                ou_name.lower(), node
+            )
+        self._child_by_dn.setdefault(parent_node.id, {})[node.data] = node
+        self._node_by_dn[node.data.lower()] = node
+
+    def _unindex_subtree(self, node):
+        """Drop the index entries of a node's descendants."""
+        for child in node.children:
+            self._unindex_subtree(child)
+            if child.data:
+                self._node_by_dn.pop(child.data.lower(), None)
+                self._object_classes.pop(child.data.lower(), None)
+        self._child_by_ou.pop(node.id, None)
+        self._child_by_dn.pop(node.id, None)
+
+    def _clear_children(self, parent_node):
+        """Remove a node's children and drop their index entries."""
+        self._unindex_subtree(parent_node)
+        parent_node.remove_children()
+
+    def get_object_classes(self, dn: str) -> Optional[FrozenSet[str]]:
+        """Get the lowercased objectClass values of an object shown in the tree.
 
-        except Exception as e:
-            import traceback
+        Returns:
+            The object's classes, or None if the tree has not loaded it
+        """
+        return self._object_classes.get(dn.lower())
 
-            traceback.print_exc()
+    def forget_object_classes(self, dn: str) -> None:
+        """Drop the objectClass entry of an object that was moved or deleted."""
+        self._object_classes.pop(dn.lower(), None)
+
+    def get_child_ou(self, parent_node, ou_name: str) -> Optional[TreeNode]:
+        """Get the OU/container child of a node by its (lowercased) name."""
+        return self._child_by_ou.get(parent_node.id, {}).get(ou_name)
+
+    def get_child_by_dn(self, parent_node, dn: str) -> Optional[TreeNode]:
+        """Get the child of a node by its DN."""
+        return self._child_by_dn.get(parent_node.id, {}).get(dn)
 
     def _is_direct_child(self, child_dn, parent_dn):
         """Check if child_dn is a direct child of parent_dn."""
@@ -122,181 +207,137 @@ class ADTree(Tree):
 
             traceback.print_exc()
 
-    def populate_ou(self, parent_node, ou_dn, synchronous=False):
-        """Populate an OU with its contents."""
-        try:
-            # Check cache first
-            if ou_dn in self.ou_cache:
-                self._populate_from_cache(parent_node, ou_dn)
-                return
-
-            def populate_op(conn: Connection):
-                # Clear existing children before populating
-                parent_node.remove_children()
-
-                # First add direct child OUs
-                self._build_direct_children(parent_node, ou_dn)
-
-                # Search for non-OU objects with a more specific filter
-                conn.search(
-                    ou_dn,
-                    "(&(objectClass=*)(!(objectClass=organizationalUnit))(!(objectClass=container))(objectCategory=*))",
-                    search_scope="LEVEL",
-                    attributes=["cn", "objectClass", "userAccountControl"],
-                    size_limit=1000,
-                )
-
-                objects = []
-                for entry in conn.entries:
-                    if self._is_direct_child(entry.entry_dn, ou_dn):
-                        objects.append(entry)
-
-                # Cache the results
-                self.ou_cache[ou_dn] = objects
-
-                # Add objects to the tree
-                for entry in objects:
-                    cn = str(entry["cn"]) if "cn" in entry else "Unknown"
-                    obj_classes = [str(cls).lower() for cls in entry["objectClass"]]
-                    entry_dn = entry.entry_dn
-
-                    if "user" in obj_classes and "computer" not in obj_classes:
-                        uac = int(entry["userAccountControl"].value)
-                        is_disabled = (uac & 2) == 2
-
-                        if is_disabled:
-                            node = parent_node.add_leaf(f"[dim]👤 {cn}[/]")
-                        else:
-                            node = parent_node.add_leaf(f"👤 {cn}")
-                        node.data = entry_dn
-                    elif "computer" in obj_classes:
-                        node = parent_node.add_leaf(f"💻 {cn}")
-                        node.data = entry_dn
-                    elif "group" in obj_classes:
-                        node = parent_node.add_leaf(f"👥 {cn}")
-                        node.data = entry_dn
-
-            if self.connection_manager:
-                self.connection_manager.execute_with_retry(populate_op)
+    def _fetch_ou_contents(
+        self, ou_dn, use_cache=True
+    ) -> Tuple[List[Tuple[str, str]], List[Any]]:
+        """Search the child OUs and the other objects directly under an OU.
+
+        Safe to call from a worker thread; nothing in the tree is touched.
+
+        Returns:
+            Tuple of ((name, dn) child OUs, object entries)
+        """
+        children = self._fetch_direct_children(ou_dn)
+        if use_cache and ou_dn in self.ou_cache:
+            return children, self.ou_cache[ou_dn]
+
+        def objects_op(conn: Connection):
+            # Search for non-OU objects with a more specific filter
+            conn.search(
+                ou_dn,
+                "(&(objectClass=*)(!(objectClass=organizationalUnit))(!(objectClass=container))(objectCategory=*))",
+                search_scope="LEVEL",
+                attributes=["cn", "objectClass", "userAccountControl"],
+                size_limit=1000,
+            )
+            return [
+                entry
+                for entry in conn.entries
+                if self._is_direct_child(entry.entry_dn, ou_dn)
+            ]
+
+        return children, self.connection_manager.execute_with_retry(objects_op)
+
+    def _show_ou_contents(self, parent_node, ou_dn, children, objects):
+        """Replace a node's children with fetched OU contents."""
+        # Cache the results
+        self.ou_cache[ou_dn] = objects
+
+        # Clear existing children before populating
+        self._clear_children(parent_node)
+
+        # First add direct child OUs
+        self._add_ou_children(parent_node, children)
+
+        # Add objects to the tree
+        for entry in objects:
+            cn = str(entry["cn"]) if "cn" in entry else "Unknown"
+            obj_classes = frozenset(str(cls).lower() for cls in entry["objectClass"])
+            entry_dn = entry.entry_dn
+            self._object_classes[entry_dn.lower()] = obj_classes
+
+            if "user" in obj_classes and "computer" not in obj_classes:
+                uac = entry["userAccountControl"].value
+                is_disabled = uac is not None and (int(uac) & 2) == 2
+
+                if is_disabled:
+                    node = parent_node.add_leaf(f"[dim]👤 {cn}[/]")
+                else:
+                    node = parent_node.add_leaf(f"👤 {cn}")
+            elif "computer" in obj_classes:
+                node = parent_node.add_leaf(f"💻 {cn}")
+            elif "group" in obj_classes:
+                node = parent_node.add_leaf(f"👥 {cn}")
             else:
-                return
+                continue
+            node.data = entry_dn
+            self._index_child(parent_node, node)
 
+    def populate_ou(self, parent_node, ou_dn, synchronous=False, use_cache=True):
+        """Populate an OU with its contents.
+
+        Unless synchronous, this runs off the UI thread and the nodes are
+        added on the UI thread once the searches are done.
+        """
+        if not self.connection_manager:
+            return
+        try:
+            children, objects = self._fetch_ou_contents(ou_dn, use_cache)
         except Exception as e:
             import traceback
 
             traceback.print_exc()
+            return
+
+        if synchronous:
+            self._show_ou_contents(parent_node, ou_dn, children, objects)
+        else:
+            self.app.call_from_thread(
+                self._show_ou_contents, parent_node, ou_dn, children, objects
+            )
 
     def populate_ou_sync(self, parent_node, ou_dn):
         """Synchronously populate an OU for navigation purposes."""
         self.populate_ou(parent_node, ou_dn, synchronous=True)
 
-    def _populate_from_cache(self, parent_node, ou_dn):
-        """Populate from cached results."""
-        try:
-            # Clear existing children before populating
-            parent_node.remove_children()
-
-            # First add direct child OUs
-            self._build_direct_children(parent_node, ou_dn)
-
-            # Add objects from cache
-            for entry in self.ou_cache[ou_dn]:
-                cn = str(entry["cn"]) if "cn" in entry else "Unknown"
-                obj_classes = [str(cls).lower() for cls in entry["objectClass"]]
-                entry_dn = entry.entry_dn
-
-                if "user" in obj_classes and "computer" not in obj_classes:
-                    node = parent_node.add_leaf(f"👤 {cn}")
-                    node.data = entry_dn
-                elif "computer" in obj_classes:
-                    node = parent_node.add_leaf(f"💻 {cn}")
-                    node.data = entry_dn
-                elif "group" in obj_classes:
-                    node = parent_node.add_leaf(f"👥 {cn}")
-                    node.data = entry_dn
-
-        except Exception as e:
-            import traceback
-
-            traceback.print_exc()
-
     def _populate_ou_fresh(self, parent_node, ou_dn):
         """Populate an OU with fresh data (bypassing cache)."""
-        try:
+        self.populate_ou(parent_node, ou_dn, synchronous=True, use_cache=False)
 
-            def fresh_populate_op(conn: Connection):
-                # Clear existing children before populating
-                parent_node.remove_children()
-
-                # First add direct child OUs
-                self._build_direct_children(parent_node, ou_dn)
-
-                # Search for non-OU objects with a more specific filter
-                conn.search(
-                    ou_dn,
-                    "(&(objectClass=*)(!(objectClass=organizationalUnit))(!(objectClass=container))(objectCategory=*))",
-                    search_scope="LEVEL",
-                    attributes=["cn", "objectClass", "userAccountControl"],
-                    size_limit=1000,
-                )
-
-                objects = []
-                for entry in conn.entries:
-                    if self._is_direct_child(entry.entry_dn, ou_dn):
-                        objects.append(entry)
-
-                # Cache the results
-                self.ou_cache[ou_dn] = objects
-
-                # Add objects to the tree
-                for entry in objects:
-                    cn = str(entry["cn"]) if "cn" in entry else "Unknown"
-                    obj_classes = [str(cls).lower() for cls in entry["objectClass"]]
-                    entry_dn = entry.entry_dn
-
-                    if "user" in obj_classes and "computer" not in obj_classes:
-                        uac = int(entry["userAccountControl"].value)
-                        is_disabled = (uac & 2) == 2
-
-                        if is_disabled:
-                            node = parent_node.add_leaf(f"[dim]👤 {cn}[/]")
-                        else:
-                            node = parent_node.add_leaf(f"👤 {cn}")
-                        node.data = entry_dn
-                    elif "computer" in obj_classes:
-                        node = parent_node.add_leaf(f"💻 {cn}")
-                        node.data = entry_dn
-                    elif "group" in obj_classes:
-                        node = parent_node.add_leaf(f"👥 {cn}")
-                        node.data = entry_dn
-
-            if self.connection_manager:
-                self.connection_manager.execute_with_retry(fresh_populate_op)
-            else:
-                return
+    def refresh_current_ou(self, then: Optional[Callable[[], None]] = None):
+        """Refresh currently selected OU.
 
-        except Exception as e:
-            import traceback
+        The directory is searched in a worker thread; the OU keeps showing
+        its current contents until the new ones arrive.
 
-            traceback.print_exc()
-
-    def refresh_current_ou(self):
-        """Refresh currently selected OU."""
+        Args:
+            then: Optional callback run on the UI thread after the refresh
+        """
         if self.connection_manager is None:
             return
         if self.cursor_node and self.cursor_node.data:
             # Clear cache for this OU
-            ou_dn = self.cursor_node.data
+            node = self.cursor_node
+            ou_dn = node.data
             if ou_dn in self.ou_cache:
                 del self.ou_cache[ou_dn]
-            if ou_dn in self.loaded_ous:
-                self.loaded_ous.remove(ou_dn)
+            self.loaded_ous.discard(ou_dn)
 
-            # Clear and repopulate with fresh data
-            self.cursor_node.remove_children()
-            self._populate_ou_fresh(self.cursor_node, ou_dn)
+            self.run_worker(
+                partial(self._refresh_ou_worker, node, ou_dn, then),
+                thread=True,
+                group="refresh-ou",
+            )
         else:
             logger.debug("OU not loaded yet, expand it first to load it")
+            if then is not None:
+                then()
+
+    def _refresh_ou_worker(self, node, ou_dn, then):
+        """Fetch an OU's contents and repopulate its node on the UI thread."""
+        self.populate_ou(node, ou_dn, use_cache=False)
+        if then is not None:
+            self.app.call_from_thread(then)
 
     def refresh_ou_by_dn(self, ou_dn: str):
         """Refresh a specific OU by finding its node in the tree."""
@@ -313,7 +354,6 @@ class ADTree(Tree):
                 self.loaded_ous.remove(ou_dn)
 
             # Clear and repopulate with fresh data
-            target_node.remove_children()
             self._populate_ou_fresh(target_node, ou_dn)
 
             # Expand the node to show refreshed content
@@ -322,18 +362,66 @@ class ADTree(Tree):
             pass
 
     def _find_node_by_dn(self, node, target_dn: str):
-        """Recursively find a tree node by its DN."""
-        if hasattr(node, "data") and node.data == target_dn:
-            return node
+        """Find a tree node by its DN."""
+        return self._node_by_dn.get(target_dn.lower())
 
-        # Search children
-        if hasattr(node, "children"):
-            for child in node.children:
-                result = self._find_node_by_dn(child, target_dn)
-                if result:
-                    return result
+    def add_node_under_dn(
+        self, parent_dn: str, dn: str, name: str, is_ou: bool = True
+    ) -> bool:
+        """Add a newly created object under its parent without reloading it.
 
-        return None
+        OUs are inserted in name order ahead of the parent's other objects;
+        users are appended.
+
+        Args:
+            parent_dn: DN of the parent OU or container
+            dn: DN of the new object
+            name: Name shown in the tree (ou or cn value)
+            is_ou: Whether the object is an OU (otherwise a user)
+
+        Returns:
+            True if the tree is up to date, False if the parent has to be
+            refreshed instead
+        """
+        parent_node = self._node_by_dn.get(parent_dn.lower())
+        if parent_node is None:
+            return False
+        if self.get_child_by_dn(parent_node, dn):
+            return True
+
+        # OUs not expanded yet pick the object up when they load; the base
+        # DN node (which has no data) only ever lists OUs
+        if parent_node.data is None:
+            if not is_ou:
+                return True
+        elif parent_node.data not in self.loaded_ous:
+            return True
+        self.ou_cache.pop(parent_node.data, None)
+
+        if not is_ou:
+            node = parent_node.add_leaf(f"👤 {name}")
+            node.data = dn
+            self._index_child(parent_node, node)
+            return True
+
+        before = None
+        after = None
+        for child in parent_node.children:
+            if not child.allow_expand:
+                # Leaves (users, groups, computers) follow all OUs
+                before = child
+                break
+            if child.label.plain[2:].lower() > name.lower():
+                before = child
+                break
+            after = child
+        if before is not None:
+            node = parent_node.add(f"📁 {name}", before=before, expand=False)
+        else:
+            node = parent_node.add(f"📁 {name}", after=after, expand=False)
+        node.data = dn
+        self._index_child(parent_node, node, name)
+        return True
 
     def remove_node_by_dn(self, dn: str) -> bool:
         """Remove a node from the tree by its DN and select the next appropriate node.
@@ -370,7 +458,15 @@ class ADTree(Tree):
                 next_node = parent
 
         # Remove the node
+        self._unindex_subtree(target_node)
         target_node.remove()
+        self._node_by_dn.pop(dn.lower(), None)
+        self.forget_object_classes(dn)
+        self._child_by_dn.get(parent.id, {}).pop(dn, None)
+        ou_index = self._child_by_ou.get(parent.id, {})
+        for name, node in list(ou_index.items()):
+            if node is target_node:
+                del ou_index[name]
 
         # Select the next appropriate node
         if next_node and next_node != self.root:
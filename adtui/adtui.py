@@ -1,11 +1,19 @@
 """ADTUI - Active Directory Terminal UI - Refactored Version."""
 
+import asyncio
 import logging
 import os
+import re
 import subprocess
-import sys
-from typing import Optional
-
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache, partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ldap3.core.exceptions import LDAPNoSuchObjectResult
+from ldap3.utils.conv import escape_filter_chars
+from ldap3.utils.dn import parse_dn
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static, Input, Footer, ListView, ListItem, Label, Tree
@@ -17,16 +25,22 @@ logger = logging.getLogger(__name__)
 try:
     from .adtree import ADTree
     from .widgets.details_pane import DetailsPane
-    from .services import LDAPService, HistoryService, PathService
+    from .widgets.group_details import GroupDetailsPane
+    from .widgets.user_details import UserDetailsPane
+    from .services import LDAPService, HistoryService, PathService, UpdateService
     from .services.config_service import ConfigService, ADConfig
     from .services.connection_manager import ConnectionManager, ConnectionState
+    from .services.platform_service import PlatformService
     from .commands import CommandHandler
     from .ui.dialogs import (
         ConfirmDeleteDialog,
-        ConfirmMoveDialog,
         ConfirmRestoreDialog,
-        ConfirmUndoDialog,
-        CreateOUDialog,
+        CopyUserDialog,
+        CreateUserDialog,
+        EditAttributesDialog,
+        ManageGroupMembersDialog,
+        ManageGroupsDialog,
+        SetPasswordDialog,
         ADSelectionDialog,
         LoginDialog,
     )
@@ -34,28 +48,124 @@ except ImportError:
     # Fallback for direct execution
     from adtree import ADTree
     from widgets.details_pane import DetailsPane
-    from services import LDAPService, HistoryService, PathService
+    from widgets.group_details import GroupDetailsPane
+    from widgets.user_details import UserDetailsPane
+    from services import LDAPService, HistoryService, PathService, UpdateService
     from services.config_service import ConfigService, ADConfig
     from services.connection_manager import ConnectionManager, ConnectionState
+    from services.platform_service import PlatformService
     from commands import CommandHandler
     from .ui.dialogs import (
         ConfirmDeleteDialog,
-        ConfirmMoveDialog,
         ConfirmRestoreDialog,
-        ConfirmUndoDialog,
-        CreateOUDialog,
+        CopyUserDialog,
+        CreateUserDialog,
+        EditAttributesDialog,
+        ManageGroupMembersDialog,
+        ManageGroupsDialog,
+        SetPasswordDialog,
         ADSelectionDialog,
         LoginDialog,
     )
-from .constants import Severity, MESSAGES
+from .constants import Severity, MESSAGES, ObjectIcon, ObjectType
+from . import __version__
+
+# Splash screen banner, constant for the lifetime of the process
+_ASCII_ART = f"""[bold palegreen]   db    888b.    88888 8    8 888 [/bold palegreen]
+[bold palegreen]  dPYb   8   8      8   8    8  8  [/bold palegreen]
+[bold palegreen] dPwwYb  8   8      8   8b..d8  8  [/bold palegreen]
+[bold palegreen]dP    Yb 888P'      8   `Y88P' 888 [/bold palegreen]
+                            [dim]v{__version__}[/dim]"""
+_SPLASH_HEADER = f"{_ASCII_ART}\n\n[bold cyan]Active Directory TUI[/bold cyan]"
+
+# Backslash escapes in DN attribute values (e.g. "Doe\\, John")
+_DN_ESCAPE = re.compile(r"\\(.)")
+
+# Separator between path components, with any surrounding whitespace and
+# repeated slashes
+_PATH_SEPARATOR = re.compile(r"\s*/[\s/]*")
+
+# ANSI escape sequences stripped from text before it is copied
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+# Label icons and the object types they mark, in the order they are checked
+_ICON_TYPES = (
+    (ObjectIcon.USER.value, ObjectType.USER),
+    (ObjectIcon.GROUP.value, ObjectType.GROUP),
+    (ObjectIcon.COMPUTER.value, ObjectType.COMPUTER),
+    (ObjectIcon.OU.value, ObjectType.OU),
+)
+
+# Search results are mounted in pages of this many items, loading the next
+# page once the highlight is within RESULTS_PAGE_MARGIN of the end
+RESULTS_PAGE_SIZE = 50
+RESULTS_PAGE_MARGIN = 5
+
+# Pause in typing before path autocomplete queries the directory (seconds)
+AUTOCOMPLETE_DEBOUNCE = 0.15
+
+# Path autocomplete keeps OU listings for this long (seconds), for at most
+# this many (parent DN, prefix) lookups
+AUTOCOMPLETE_CACHE_TTL = 30.0
+AUTOCOMPLETE_CACHE_SIZE = 256
+
+# Maximum number of OUs fetched per autocomplete lookup
+AUTOCOMPLETE_LIMIT = 50
+
+# Entries shown in the details pane are reused for this long (seconds), for
+# at most this many objects. Changes made in this session drop the entries
+# they touch; changes made elsewhere can show up late by up to the TTL, or
+# at once after a refresh (r / :refresh), which empties the cache
+DETAILS_CACHE_TTL = 30.0
+DETAILS_CACHE_SIZE = 256
+
+# Details of up to this many objects around the selected tree node are
+# fetched together in one search
+DETAILS_PREFETCH_COUNT = 32
+
+# Tree refreshes requested by LDAP results within this window are merged
+# into one (seconds)
+REFRESH_COALESCE_DELAY = 0.1
+
+# Number of objectClass checks remembered by _is_user_object
+USER_CHECK_CACHE_SIZE = 1024
+
+# Delay used to coalesce bursts of connection state changes (seconds)
+STATE_FLUSH_DELAY = 0.05
 
 # Configuration will be loaded after AD selection
 LAST_USER_FILE = "last_user.txt"
 
-last_user = ""
-if os.path.exists(LAST_USER_FILE):
-    with open(LAST_USER_FILE, "r") as f:
-        last_user = f.read().strip()
+
+@lru_cache(maxsize=1)
+def get_last_user() -> str:
+    """Get the username of the last successful login.
+
+    Returns:
+        Username read from LAST_USER_FILE, or "" if none was saved
+    """
+    try:
+        with open(LAST_USER_FILE, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+@lru_cache(maxsize=256)
+def _ou_path_from_dn(dn: str) -> Tuple[str, ...]:
+    """Get the lowercased OU names above an object, ordered root to leaf.
+
+    Args:
+        dn: Distinguished Name of the object
+
+    Returns:
+        Tuple of OU names, e.g. ("corp", "it") for "cn=x,ou=IT,ou=Corp,dc=..."
+    """
+    return tuple(
+        _DN_ESCAPE.sub(r"\1", value).lower()
+        for attr, value, _ in reversed(parse_dn(dn)[1:])
+        if attr.lower() == "ou"
+    )
 
 
 def create_connection_manager(
@@ -89,6 +199,7 @@ def create_connection_manager(
         initial_retry_delay=ad_config.initial_retry_delay,
         max_retry_delay=ad_config.max_retry_delay,
         health_check_interval=ad_config.health_check_interval,
+        pool_size=ad_config.pool_size,
     )
 
     if not ad_config.use_ssl:
@@ -98,11 +209,17 @@ def create_connection_manager(
 
 
 class SearchResultsPane(ListView):
-    """ListView for displaying search results."""
+    """ListView for displaying search results.
+
+    Results are kept as plain dicts and mounted as list items one page at a
+    time, as the highlight approaches the last mounted item.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.connection_manager = None
+        self._results: List[Dict] = []
+        self._mounted_count = 0
 
     def populate(self, results, connection_manager=None):
         """Populate the search results pane.
@@ -111,18 +228,40 @@ class SearchResultsPane(ListView):
             results: List of result dictionaries with 'label' and 'dn'
             connection_manager: Optional ConnectionManager instance
         """
-        self.clear()
         self.connection_manager = connection_manager
-        for result in results:
-            item = ListItem(Label(result["label"]))
-            item.text = result["label"]
-            item.data = result["dn"]
-            self.append(item)
+        self._results = results
+        self._mounted_count = 0
+        with self.app.batch_update():
+            self.clear()
+            self._mount_next_page()
 
         # Auto-highlight first item
         if len(results) > 0:
             self.index = 0
 
+    def _mount_next_page(self):
+        """Mount the next page of result items."""
+        end = min(self._mounted_count + RESULTS_PAGE_SIZE, len(self._results))
+        items = []
+        for result in self._results[self._mounted_count : end]:
+            item = ListItem(Label(result["label"]))
+            item.text = result["label"]
+            item.data = result["dn"]
+            item.path = result.get("path")
+            items.append(item)
+        # Mount the whole page at once rather than one item per append
+        self.extend(items)
+        self._mounted_count = end
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted):
+        """Mount more results when the highlight nears the last mounted item."""
+        if (
+            self._mounted_count < len(self._results)
+            and self.index is not None
+            and self.index >= self._mounted_count - RESULTS_PAGE_MARGIN
+        ):
+            self._mount_next_page()
+
 
 class ADTUI(App):
     """Main Active Directory TUI Application."""
@@ -148,11 +287,16 @@ class ADTUI(App):
         Binding("tab", "cycle_focus", "Cycle Focus", show=False),
     ]
 
+    # Set when the app exits because authentication failed, so whoever ran
+    # it can tell that apart from a normal quit
+    auth_failed: bool = False
+
     def __init__(
         self,
         username: Optional[str] = None,
         password: Optional[str] = None,
         ad_config: Optional[ADConfig] = None,
+        config_service: Optional[ConfigService] = None,
     ):
         """Initialize the application.
 
@@ -160,10 +304,22 @@ class ADTUI(App):
             username: AD username (optional for deferred login)
             password: AD password (optional for deferred login)
             ad_config: AD configuration (optional for deferred login)
+            config_service: Loaded configuration, used to log in from within
+                the app when no credentials are given
         """
         super().__init__()
 
+        # Connection state changes waiting to be shown (see _flush_state)
+        self._pending_states: Deque[Tuple[ConnectionState, Optional[str]]] = deque()
+        self._pending_states_lock = threading.Lock()
+        self._state_flush_timer = None
+        self._refresh_timer = None
+        self._after_refresh: List[Callable[[], None]] = []
+        self._rendered_state: Optional[ConnectionState] = None
+
         self.ad_config = ad_config
+        self.config_service = config_service
+        self.selected_domain: Optional[str] = None
 
         # Only establish connection if credentials are provided
         if username is not None and password is not None and ad_config is not None:
@@ -183,23 +339,39 @@ class ADTUI(App):
             self.path_service = None
             self.command_handler = None
             # Create placeholder widgets
-            from adtree import ADTree
-
             self.base_dn = ad_config.base_dn if ad_config else ""
             self.adtree = ADTree(None, self.base_dn)
             self.details = DetailsPane(id="details-pane")
             self.search_results_pane = SearchResultsPane(id="search-results-pane")
 
+        # Command/search input, created with the main layout
+        self.command_input: Optional[Input] = None
+
         # State management
         self.command_mode = False
         self.autocomplete_mode = False
 
+        # Child OUs/containers per (lowercased parent DN, name prefix), with
+        # the time they were fetched, used by path autocomplete
+        self._ou_children_cache: "OrderedDict[Tuple[str, str], Tuple[float, List[Dict]]]" = (
+            OrderedDict()
+        )
+        # Whether a lowercased DN is a user, filled by _is_user_object and
+        # evicted least recently used first. Worker threads fill it too, so
+        # every access holds _is_user_lock.
+        self._is_user_cache: "OrderedDict[str, bool]" = OrderedDict()
+        self._is_user_lock = threading.Lock()
+        # Entries fetched by the details pane per lowercased DN, with the time
+        # they were fetched
+        self._detail_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Bumped whenever the details cache is cleared, so prefetches started
+        # before that are discarded
+        self._detail_generation = 0
+
         # Current selection
         self.current_selected_dn: Optional[str] = None
         self.current_selected_label: Optional[str] = None
-
-        # Auth failure flag - used to signal main() to restart login flow
-        self.auth_failed = False
+        self.current_selected_type: Optional[ObjectType] = None
 
         # Update check result (populated asynchronously)
         self._update_result = None
@@ -238,18 +410,11 @@ class ADTUI(App):
 
     def compose(self) -> ComposeResult:
         """Compose the UI layout."""
-        # Ensure all required attributes exist
-        if not hasattr(self, "adtree") or self.adtree is None:
-            from adtree import ADTree
-
-            self.base_dn = getattr(self, "base_dn", "")
-            self.adtree = ADTree(None, self.base_dn)
-
-        if not hasattr(self, "details") or self.details is None:
-            self.details = DetailsPane(id="details-pane")
-
-        if not hasattr(self, "search_results_pane") or self.search_results_pane is None:
-            self.search_results_pane = SearchResultsPane(id="search-results-pane")
+        if self.connection_manager is None and self.config_service is not None:
+            # Deferred login - the real layout is mounted by _rebuild_ui()
+            yield Static(self._splash_text("Initializing..."), id="splash")
+            yield Footer()
+            return
 
         with Horizontal():
             with Vertical():
@@ -257,54 +422,201 @@ class ADTUI(App):
             with Vertical():
                 yield self.details
                 yield self.search_results_pane
-        yield Input(placeholder=": command/search", id="command-input")
+        self.command_input = Input(placeholder=": command/search", id="command-input")
+        yield self.command_input
         yield Footer()
 
     def on_mount(self):
         """Handle mount event."""
-        cmd_input = self.query_one("#command-input", Input)
-        cmd_input.visible = False
+        if self.connection_manager is None and self.config_service is not None:
+            self._start_update_check()
+            self._start_login()
+            return
+
+        self.command_input.visible = False
         self._update_footer()
 
-        # Expand tree to show root level on startup with delay to ensure initialization
-        self.set_timer(0.5, self._expand_tree_on_startup)
-        # Also try to rebuild tree after a longer delay to ensure connection is ready
-        self.set_timer(2.0, self._delayed_tree_rebuild)
+        # Expand tree to show root level once the layout has been rendered
+        self.call_after_refresh(self._expand_tree_on_startup)
 
         # Check for updates in background
         self._start_update_check()
 
+    @staticmethod
+    def _splash_text(status: str) -> str:
+        """Build the splash screen shown while no session is active."""
+        return f"{_SPLASH_HEADER}\n\n[dim]{status}[/dim]"
+
+    # ==================== Login Flow ====================
+
+    def _start_login(self) -> None:
+        """Show domain selection if several domains are configured, else login."""
+        if self.config_service.has_multiple_domains():
+            self.push_screen(
+                ADSelectionDialog(self.config_service.ad_configs),
+                self._handle_ad_selection,
+            )
+        else:
+            self.selected_domain = self.config_service.get_default_domain()
+            self._show_login()
+
+    def _handle_ad_selection(self, domain) -> None:
+        """Handle AD domain selection."""
+        if domain:
+            self.selected_domain = domain
+            self._show_login()
+        else:
+            self._on_login_cancelled()
+
+    def _show_login(self) -> None:
+        """Show the login dialog for the selected domain."""
+        ad_config = self.config_service.get_config(self.selected_domain)
+        self.push_screen(
+            LoginDialog(self._get_last_user(), ad_config.domain, ad_config),
+            self._handle_login,
+        )
+
+    def _handle_login(self, result) -> None:
+        """Handle login result and initialize the session."""
+        if not result:
+            self._on_login_cancelled()
+            return
+
+        username, password = result
+        self._remember_user(username)
+
+        ad_config = self.config_service.get_config(self.selected_domain)
+        self.ad_config = ad_config
+        self.base_dn = ad_config.base_dn
+
+        try:
+            self.connection_manager = create_connection_manager(
+                username, password, ad_config
+            )
+        except Exception as e:
+            logger.exception("Login failed")
+            self.notify(f"Login failed: {e}", severity="error", timeout=5)
+            self._show_login()
+            return
+
+        # Authentication errors (or exhausted retries) leave the manager FAILED
+        if self.connection_manager.get_state() == ConnectionState.FAILED:
+            error = self.connection_manager.get_last_error()
+            self.connection_manager.close()
+            self.connection_manager = None
+            self.notify(f"Login failed: {error}", severity="error", timeout=5)
+            self._show_login()
+            return
+
+        self.connection_manager.set_auth_failure_callback(
+            self._on_authentication_failure
+        )
+
+        # Initialize all services (this also creates the real widgets)
+        self._initialize_services()
+        self._rebuild_ui()
+
+    def _on_login_cancelled(self) -> None:
+        """Handle the user cancelling domain selection or login."""
+        self.exit()
+
+    def _get_last_user(self) -> str:
+        """Get the username to prefill in the login dialog."""
+        return get_last_user()
+
+    def _remember_user(self, username: str) -> None:
+        """Persist the username for the next login, if it changed."""
+        if username == get_last_user():
+            return
+        # Replace the file in one step so a crash never leaves it truncated
+        tmp_file = f"{LAST_USER_FILE}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                f.write(username)
+            os.replace(tmp_file, LAST_USER_FILE)
+        except OSError as e:
+            logger.debug("Could not save last user: %s", e)
+        get_last_user.cache_clear()
+
+    def _rebuild_ui(self) -> None:
+        """Mount the main layout after a successful login."""
+        # Remove splash screen and footer
+        self.query("#splash, Footer").remove()
+
+        horizontal = Horizontal()
+        self.mount(horizontal)
+
+        left_vertical = Vertical()
+        right_vertical = Vertical()
+        horizontal.mount(left_vertical)
+        horizontal.mount(right_vertical)
+
+        left_vertical.mount(self.adtree)
+        right_vertical.mount(self.details)
+        right_vertical.mount(self.search_results_pane)
+
+        self.command_input = Input(placeholder=": command/search", id="command-input")
+        self.command_input.visible = False
+        self.mount(self.command_input)
+
+        self.mount(Footer())
+
+        # Expand tree to show root level once the layout has been rendered
+        self.call_after_refresh(self._expand_tree_on_startup)
+
+        self._update_footer()
+
+    def _clear_ui(self) -> None:
+        """Remove the main layout and show the splash screen again."""
+        # One batched removal instead of detaching every widget separately
+        self.query("*").remove()
+        self.command_input = None
+
+        self.mount(Static(self._splash_text("Disconnected..."), id="splash"))
+        self.mount(Footer())
+
+    def _reset_session(self) -> None:
+        """Drop the current connection and the services bound to it."""
+        self.connection_manager = None
+        self.ldap_service = None
+        self.history_service = None
+        self.path_service = None
+        self.command_handler = None
+        self._ou_children_cache.clear()
+        self.forget_user_checks()
+        self._clear_details()
+
     def _start_update_check(self):
         """Start background update check."""
-        try:
-            from .services.update_service import UpdateService
+        self.run_worker(self._check_for_update(), group="update-check", exclusive=True)
 
-            update_service = UpdateService()
-            update_service.check_for_update_async(self._on_update_check_complete)
+    async def _check_for_update(self):
+        """Run the update check and report the result."""
+        try:
+            result = await UpdateService().check_for_update_async()
         except Exception as e:
-            logger.debug(f"Failed to start update check: {e}")
+            logger.debug(f"Update check failed: {e}")
+            return
+        self._on_update_check_complete(result)
 
     def _on_update_check_complete(self, result):
         """Handle update check completion."""
         self._update_result = result
 
         if result.update_available:
-            def show_notification():
-                self.notify(
-                    f"Update available: {result.current_version} -> {result.latest_version}. "
-                    f"Use :update to upgrade.",
-                    severity="information",
-                    timeout=10,
-                )
-            # Use call_from_thread since this is from background thread
-            self.call_from_thread(show_notification)
+            self.notify(
+                f"Update available: {result.current_version} -> {result.latest_version}. "
+                f"Use :update to upgrade.",
+                severity="information",
+                timeout=10,
+            )
 
     # ==================== Command Mode Actions ====================
 
     def action_command_mode(self):
         """Enter command mode with : prefix."""
         self.command_mode = True
-        cmd_input = self.query_one("#command-input", Input)
+        cmd_input = self.command_input
         cmd_input.visible = True
         cmd_input.focus()
         self.set_timer(0.01, lambda: self._set_input_prefix(":"))
@@ -312,29 +624,77 @@ class ADTUI(App):
     def action_search_mode(self):
         """Enter search mode with / prefix (vim-style)."""
         self.command_mode = True
-        cmd_input = self.query_one("#command-input", Input)
+        cmd_input = self.command_input
         cmd_input.placeholder = "Search..."
         cmd_input.visible = True
         cmd_input.focus()
         self.set_timer(0.01, lambda: self._set_input_prefix("/"))
 
-    def action_refresh_ou(self):
-        """Refresh the currently selected OU."""
-        self.adtree.refresh_current_ou()
+    def action_refresh_ou(self, then: Optional[Callable[[], None]] = None):
+        """Refresh the currently selected OU.
+
+        Args:
+            then: Optional callback run once the refreshed OU is displayed
+        """
+        self._ou_children_cache.clear()
+        self._clear_details()
+        self.adtree.refresh_current_ou(then)
+
+    def _schedule_refresh_ou(self, then: Optional[Callable[[], None]] = None) -> None:
+        """Refresh the current OU once a burst of LDAP results has settled.
+
+        Undoing several operations in a row then rebuilds the tree once
+        instead of once per operation.
+
+        Args:
+            then: Optional callback run once the refreshed tree is displayed
+        """
+        if then is not None:
+            self._after_refresh.append(then)
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(
+                REFRESH_COALESCE_DELAY, self._flush_refresh_ou
+            )
+
+    def _flush_refresh_ou(self) -> None:
+        """Run the refresh armed by _schedule_refresh_ou."""
+        self._refresh_timer = None
+        callbacks, self._after_refresh = self._after_refresh, []
+        # The main layout may have been torn down by a logout meanwhile
+        if not self.adtree.is_attached:
+            return
+
+        def refreshed():
+            for callback in callbacks:
+                self.call_after_refresh(callback)
+
+        self.action_refresh_ou(then=refreshed)
+
+    def _forget_ou_children(self, ou_dn: str) -> None:
+        """Drop the autocomplete listings of an OU's children."""
+        base = ou_dn.lower()
+        for key in [key for key in self._ou_children_cache if key[0] == base]:
+            del self._ou_children_cache[key]
 
     def refresh_specific_ou(self, ou_dn: str):
         """Refresh a specific OU by DN."""
+        self._forget_ou_children(ou_dn)
         # Find the tree node for this OU and refresh it
         self.adtree.refresh_ou_by_dn(ou_dn)
 
     def action_cancel_command(self):
         """Cancel command mode and hide input."""
+        if isinstance(self.screen, (ADSelectionDialog, LoginDialog)):
+            # Escape during domain selection or login cancels the dialog
+            self.screen.dismiss(None)
+            return
         if self.command_mode:
-            cmd_input = self.query_one("#command-input", Input)
+            cmd_input = self.command_input
             cmd_input.value = ""
             cmd_input.visible = False
             self.command_mode = False
             self.autocomplete_mode = False
+            self.workers.cancel_group(self, "autocomplete")
             # Hide search results if visible
             self.search_results_pane.styles.display = "none"
             # Return focus to tree
@@ -345,7 +705,7 @@ class ADTUI(App):
         # In autocomplete mode, tab between input and results
         if self.autocomplete_mode:
             focused = self.focused
-            cmd_input = self.query_one("#command-input", Input)
+            cmd_input = self.command_input
 
             # If currently on input or not on results, go to results
             if focused == cmd_input or focused != self.search_results_pane:
@@ -363,8 +723,6 @@ class ADTUI(App):
         if not self.current_selected_dn:
             self.notify("No object selected", severity="warning")
             return
-        from .ui.dialogs import EditAttributesDialog
-
         self.push_screen(
             EditAttributesDialog(self.current_selected_dn, self.connection_manager)
         )
@@ -376,12 +734,8 @@ class ADTUI(App):
             return
 
         # Determine object type
-        if self.current_selected_label and "👤" in str(self.current_selected_label):
-            from .ui.dialogs import ManageGroupsDialog
-
+        if self.current_selected_type is ObjectType.USER:
             # Need to load user details first
-            from widgets.user_details import UserDetailsPane
-
             user_details = UserDetailsPane()
             user_details.update_user_details(
                 self.current_selected_dn, self.connection_manager
@@ -394,10 +748,7 @@ class ADTUI(App):
                     self.base_dn,
                 )
             )
-        elif self.current_selected_label and "👥" in str(self.current_selected_label):
-            from .ui.dialogs import ManageGroupMembersDialog
-            from widgets.group_details import GroupDetailsPane
-
+        elif self.current_selected_type is ObjectType.GROUP:
             group_details = GroupDetailsPane()
             group_details.update_group_details(
                 self.current_selected_dn, self.connection_manager
@@ -419,9 +770,7 @@ class ADTUI(App):
             self.notify("No object selected", severity="warning")
             return
 
-        if self.current_selected_label and "👤" in str(self.current_selected_label):
-            from .ui.dialogs import SetPasswordDialog
-
+        if self.current_selected_type is ObjectType.USER:
             self.push_screen(
                 SetPasswordDialog(self.current_selected_dn, self.connection_manager)
             )
@@ -440,7 +789,7 @@ class ADTUI(App):
         # Show confirmation dialog
         self.push_screen(
             ConfirmDeleteDialog(
-                str(self.current_selected_label) if self.current_selected_label else "",
+                self.current_selected_label or "",
                 self.current_selected_dn,
             ),
             self.handle_delete_confirmation,
@@ -463,7 +812,7 @@ class ADTUI(App):
 
     def _set_input_prefix(self, prefix: str):
         """Set the input prefix and move cursor to end."""
-        cmd_input = self.query_one("#command-input", Input)
+        cmd_input = self.command_input
         cmd_input.value = prefix
         cmd_input.cursor_position = len(prefix)
 
@@ -478,26 +827,53 @@ class ADTUI(App):
     ):
         """Handle connection state changes.
 
+        State changes are queued and flushed to the UI in batches so that a
+        burst of reconnect attempts results in a single notification and at
+        most one tree rebuild.
+
         Args:
             state: New connection state
             error: Optional error message
         """
+        with self._pending_states_lock:
+            self._pending_states.append((state, error))
+
+        # call_later is thread-safe and, unlike call_from_thread, also works
+        # when the state change originates on the UI thread
+        self.call_later(self._schedule_state_flush)
+
+    def _schedule_state_flush(self) -> None:
+        """Arm the state flush timer unless one is already pending."""
+        if self._state_flush_timer is None:
+            self._state_flush_timer = self.set_timer(
+                STATE_FLUSH_DELAY, self._flush_state
+            )
 
-        # Use call_from_thread since this callback may be invoked from background threads
-        def update_ui():
-            if state == ConnectionState.CONNECTED:
-                self.notify("Connected to Active Directory", severity="information")
-                # Rebuild tree when connection is established
-                if hasattr(self, "adtree") and self.adtree:
-                    self.adtree.build_tree()
-            elif state == ConnectionState.RECONNECTING:
-                self.notify(f"Reconnecting to AD... {error or ''}", severity="warning")
-            elif state == ConnectionState.FAILED:
-                self.notify(
-                    f"Connection failed: {error or 'Unknown error'}", severity="error"
-                )
+    def _flush_state(self) -> None:
+        """Render the most recent queued connection state."""
+        self._state_flush_timer = None
+        with self._pending_states_lock:
+            if not self._pending_states:
+                return
+            state, error = self._pending_states[-1]
+            self._pending_states.clear()
 
-        self.call_from_thread(update_ui)
+        # Nothing changed since the last update that was shown
+        if state is self._rendered_state:
+            return
+        self._rendered_state = state
+
+        if state is ConnectionState.CONNECTED:
+            self.notify("Connected to Active Directory", severity="information")
+            # Rebuild tree when connection is established
+            if hasattr(self, "adtree") and self.adtree:
+                self.adtree.build_tree_in_background()
+        elif state is ConnectionState.RECONNECTING:
+            self.notify(f"Reconnecting to AD... {error or ''}", severity="warning")
+        elif state is ConnectionState.FAILED:
+            self.notify(
+                f"Connection failed: {error or 'Unknown error'}", severity="error"
+            )
 
     def _on_authentication_failure(self):
         """Handle authentication failure - exit to restart login flow."""
@@ -505,15 +881,20 @@ class ADTUI(App):
         # Use call_from_thread since this may be called from connection manager's background thread
         def handle_auth_failure():
             try:
-                # Set auth failure flag so main() knows to restart login
-                self.auth_failed = True
-
                 # Clear current connection and services
-                self.connection_manager = None
-                self.ldap_service = None
-                self.history_service = None
-                self.path_service = None
-                self.command_handler = None
+                self._reset_session()
+
+                if self.config_service is not None:
+                    # Log in again without leaving the app
+                    self._clear_ui()
+                    self.notify(
+                        "Authentication failed. Please log in again.", severity="error"
+                    )
+                    self._start_login()
+                    return
+
+                # Set auth failure flag so callers know to restart login
+                self.auth_failed = True
 
                 # Reset tree to empty state
                 if hasattr(self, "adtree") and self.adtree:
@@ -523,7 +904,6 @@ class ADTUI(App):
                 if hasattr(self, "details") and self.details:
                     self.details.update_content("No connection", None, None)
 
-                # Exit main app to trigger login restart in main script
                 self.exit()
 
             except Exception as e:
@@ -555,11 +935,62 @@ class ADTUI(App):
                 path_input = value[prefix_len:]
                 # Trigger autocomplete if ends with / or has content
                 if path_input.endswith("/") or len(path_input) >= 1:
-                    self.show_path_autocomplete(path_input)
+                    # Restarting the worker drops the lookup for the previous keystroke
+                    self.run_worker(
+                        self._debounced_autocomplete(path_input),
+                        group="autocomplete",
+                        exclusive=True,
+                    )
             elif self.autocomplete_mode:
+                self.workers.cancel_group(self, "autocomplete")
                 self.autocomplete_mode = False
                 self.search_results_pane.styles.display = "none"
 
+    def _cached_child_ous(self, search_base: str, prefix: str) -> Optional[List[Dict]]:
+        """Get cached OUs/containers directly under a DN whose name starts with prefix.
+
+        Results are cached per (parent, prefix) for AUTOCOMPLETE_CACHE_TTL
+        seconds, for at most AUTOCOMPLETE_CACHE_SIZE lookups (least recently
+        used first out). A cached result for a shorter prefix that was not cut
+        off by AUTOCOMPLETE_LIMIT holds every match for a longer one, so the
+        longest such prefix is filtered locally instead of searching again.
+
+        Args:
+            search_base: DN to list
+            prefix: Lowercased name prefix, "" for all children
+
+        Returns:
+            List of OU/container dictionaries, or None if not cached
+        """
+        base = search_base.lower()
+        now = time.monotonic()
+        for length in range(len(prefix), -1, -1):
+            key = (base, prefix[:length])
+            cached = self._ou_children_cache.get(key)
+            if cached is None or now - cached[0] >= AUTOCOMPLETE_CACHE_TTL:
+                continue
+            ous = cached[1]
+            if length == len(prefix):
+                self._ou_children_cache.move_to_end(key)
+                return ous
+            if len(ous) < AUTOCOMPLETE_LIMIT:
+                self._ou_children_cache.move_to_end(key)
+                return [ou for ou in ous if ou["name"].lower().startswith(prefix)]
+        return None
+
+    def _cache_child_ous(self, search_base: str, prefix: str, ous: List[Dict]) -> None:
+        """Remember an autocomplete lookup, evicting the least recently used."""
+        key = (search_base.lower(), prefix)
+        self._ou_children_cache[key] = (time.monotonic(), ous)
+        self._ou_children_cache.move_to_end(key)
+        while len(self._ou_children_cache) > AUTOCOMPLETE_CACHE_SIZE:
+            self._ou_children_cache.popitem(last=False)
+
+    async def _debounced_autocomplete(self, path_input: str):
+        """Show path autocomplete once typing has paused."""
+        await asyncio.sleep(AUTOCOMPLETE_DEBOUNCE)
+        await self.show_path_autocomplete(path_input)
+
     def on_input_submitted(self, event: Input.Submitted):
         """Handle command submission."""
         if self.command_mode:
@@ -569,22 +1000,42 @@ class ADTUI(App):
             self.command_handler.execute(cmd)
 
             # Cleanup
-            cmd_input = self.query_one("#command-input", Input)
+            cmd_input = self.command_input
             cmd_input.value = ""
             cmd_input.visible = False
             self.command_mode = False
             self.autocomplete_mode = False
+            self.workers.cancel_group(self, "autocomplete")
 
     # ==================== Selection Handlers ====================
 
     def on_tree_node_selected(self, event: Tree.NodeSelected):
         """Handle tree node selection."""
         node = event.node
+        # Keep the plain text so later handlers never re-render the rich label
+        label = node.label.plain
         self.current_selected_dn = node.data
-        self.current_selected_label = node.label
-        self.details.update_content(node.label, node.data, self.connection_manager)
+        self.current_selected_label = label
+        self.current_selected_type = self._object_type_from_label(label)
+        self.details.update_content(label, node.data, self.connection_manager)
+        self._prefetch_details(node)
         self._update_footer()
 
+    @staticmethod
+    def _object_type_from_label(label: str) -> Optional[ObjectType]:
+        """Determine the object type from a tree or list label's icon.
+
+        Args:
+            label: Plain node label
+
+        Returns:
+            ObjectType for users, groups, computers and OUs/containers, else None
+        """
+        for icon, object_type in _ICON_TYPES:
+            if icon in label:
+                return object_type
+        return None
+
     def on_list_view_highlighted(self, event: ListView.Highlighted):
         """Handle list view highlighting."""
         if event.list_view.id == "search-results-pane" and not self.autocomplete_mode:
@@ -592,6 +1043,7 @@ class ADTUI(App):
             if hasattr(item, "data") and item.data:
                 self.current_selected_dn = item.data
                 self.current_selected_label = item.text
+                self.current_selected_type = self._object_type_from_label(item.text)
                 self.details.update_content(
                     item.text, item.data, self.connection_manager
                 )
@@ -604,26 +1056,26 @@ class ADTUI(App):
             if hasattr(item, "data"):
                 if self.autocomplete_mode:
                     # Autocomplete: complete the path
-                    label = item.text
-                    if "📁" in label:
-                        # Extract path, preserving spaces
-                        path = label.replace("📁 ", "").strip()
-                        cmd_input = self.query_one("#command-input", Input)
+                    path = item.path
+                    if path:
+                        cmd_input = self.command_input
                         # Always end with / to show next level
                         if not path.endswith("/"):
                             path = path + "/"
                         cmd_input.value = f":m {path}"
                         cmd_input.cursor_position = len(cmd_input.value)
                         # Trigger next autocomplete
-                        self.show_path_autocomplete(path)
+                        self.run_worker(
+                            self.show_path_autocomplete(path),
+                            group="autocomplete",
+                            exclusive=True,
+                        )
                         # Keep focus on search results so user can continue navigating
-                        self.set_timer(0.05, lambda: self.search_results_pane.focus())
-                elif "[Deleted]" in str(item.text):
+                        self.call_after_refresh(self.search_results_pane.focus)
+                elif "[Deleted]" in item.text:
                     # Deleted object from recycle bin: offer to restore
                     self.pending_restore_dn = item.data
                     self.pending_restore_label = item.text
-                    from .ui.dialogs import ConfirmRestoreDialog
-
                     self.push_screen(
                         ConfirmRestoreDialog(item.text, item.data),
                         self.handle_restore_confirmation,
@@ -632,15 +1084,18 @@ class ADTUI(App):
                     # Search result: show details and expand tree
                     self.current_selected_dn = item.data
                     self.current_selected_label = item.text
+                    self.current_selected_type = self._object_type_from_label(
+                        item.text
+                    )
                     self.details.update_content(
                         item.text, item.data, self.connection_manager
                     )
                     # Hide search results first
                     self.search_results_pane.styles.display = "none"
-                    # Expand tree with slightly longer delay to ensure UI is ready
-                    self.set_timer(0.2, lambda: self.expand_tree_to_dn(item.data))
+                    # Expand tree once the search results are hidden
+                    self.call_after_refresh(self.expand_tree_to_dn, item.data)
                     # Return focus to tree after expansion
-                    self.set_timer(0.4, lambda: self.adtree.focus())
+                    self.call_after_refresh(self.adtree.focus)
 
     # ==================== Tree Navigation ====================
 
@@ -654,18 +1109,8 @@ class ADTUI(App):
             return
 
         try:
-            # Parse DN into components (skip the object itself, get parent path)
-            dn_parts = dn.split(",")
-
-            # Find OUs in the path (skip first part which is the object)
-            ou_path = []
-            for part in dn_parts[1:]:
-                if part.lower().startswith("ou="):
-                    ou_name = part.split("=", 1)[1]
-                    ou_path.append(ou_name)
-
-            # Reverse to get from root to leaf
-            ou_path.reverse()
+            # OU names from root to leaf, lowercased (object itself skipped)
+            ou_path = _ou_path_from_dn(dn)
 
             # Start from the base DN node (first child of root)
             if not self.adtree.root.children:
@@ -693,23 +1138,14 @@ class ADTUI(App):
                 self.adtree.ensure_node_loaded(current_node)
 
                 # Find the child with this OU name
-                found = False
-                for child in current_node.children:
-                    child_label = str(child.label)
-                    # Remove emoji and extra spaces
-                    clean_label = child_label.replace("📁", "").strip()
-                    # Case-insensitive comparison
-                    if clean_label.lower() == ou_name.lower():
-                        current_node = child
-                        found = True
-                        break
-
-                if not found:
+                child = self.adtree.get_child_ou(current_node, ou_name)
+                if child is None:
                     # Can't navigate further - OU not found in tree
                     self.notify(
                         f"Could not find OU '{ou_name}' in tree", severity="warning"
                     )
                     return
+                current_node = child
 
             # Expand the final OU to show its contents
             if current_node and current_node != self.adtree.root:
@@ -717,15 +1153,8 @@ class ADTUI(App):
                     current_node.expand()
                     # Ensure final node is loaded
                     self.adtree.ensure_node_loaded(current_node)
-                    # Add delay for tree to render after expansion
-                    self.set_timer(
-                        0.2, lambda: self._select_object_in_tree(current_node, dn)
-                    )
-                else:
-                    # Select object in the final OU with small delay
-                    self.set_timer(
-                        0.1, lambda: self._select_object_in_tree(current_node, dn)
-                    )
+                # Select once the tree has laid out the new lines
+                self.call_after_refresh(self._select_object_in_tree, current_node, dn)
 
         except Exception as e:
             self.notify(f"Could not expand tree to DN: {e}", severity="warning")
@@ -739,18 +1168,10 @@ class ADTUI(App):
         """
         try:
             # Look for the object in the parent's children
-            found = False
-            for child in parent_node.children:
-                if hasattr(child, "data") and child.data == target_dn:
-                    # Select node first
-                    self.adtree.select_node(child)
-                    # Focus tree to ensure cursor is on selected node
-                    self.adtree.focus()
-                    found = True
-                    break
+            child = self.adtree.get_child_by_dn(parent_node, target_dn)
 
             # If object not found, it might be because the OU wasn't fully loaded
-            if not found:
+            if child is None:
                 # Try to reload the OU and search again
                 if hasattr(parent_node, "data") and parent_node.data:
                     # Clear the loaded flag to force reload
@@ -761,76 +1182,53 @@ class ADTUI(App):
                     self.adtree.ensure_node_loaded(parent_node)
 
                     # Try finding the object again
-                    for child in parent_node.children:
-                        if hasattr(child, "data") and child.data == target_dn:
-                            # Select node first
-                            self.adtree.select_node(child)
-                            # Focus tree to ensure cursor is on selected node
-                            self.adtree.focus()
-                            found = True
-                            break
-
-                if not found:
-                    # Object still not found - notify user
-                    self.notify(
-                        "Object found but not visible in tree", severity="information"
-                    )
+                    child = self.adtree.get_child_by_dn(parent_node, target_dn)
+
+            if child is not None:
+                # Select node first
+                self.adtree.select_node(child)
+                # Focus tree to ensure cursor is on selected node
+                self.adtree.focus()
+            else:
+                # Object still not found - notify user
+                self.notify(
+                    "Object found but not visible in tree", severity="information"
+                )
 
         except Exception as e:
             self.notify(f"Could not select object in tree: {e}", severity="warning")
 
     def _expand_tree_on_startup(self) -> None:
         """Expand tree to show root level on startup."""
+        # The tree always exists; it is only empty when not connected
+        if self.adtree.connection_manager is None or not self.adtree.root.children:
+            return
+        root_node = self.adtree.root.children[0]  # Base DN node
         try:
-            if (
-                hasattr(self, "adtree")
-                and self.adtree
-                and hasattr(self.adtree, "connection_manager")
-                and self.adtree.connection_manager
-                and hasattr(self.adtree, "root")
-                and self.adtree.root
-                and hasattr(self.adtree.root, "children")
-                and self.adtree.root.children
-            ):
-                root_node = self.adtree.root.children[0]  # Base DN node
-                # Ensure root node is expanded and loaded
-                if not root_node.is_expanded:
-                    root_node.expand()
-                    self.adtree.ensure_node_loaded(root_node)
+            # Ensure root node is expanded and loaded
+            if not root_node.is_expanded:
+                root_node.expand()
+                self.adtree.ensure_node_loaded(root_node)
         except Exception as e:
             # Silently fail - tree expansion is a nice-to-have feature
             pass
 
-    def _delayed_tree_rebuild(self) -> None:
-        """Rebuild tree after delay to ensure connection is ready."""
-        try:
-            if (
-                hasattr(self, "adtree")
-                and self.adtree
-                and self.adtree.connection_manager
-            ):
-                self.adtree.build_tree()
-        except Exception as e:
-            import traceback
-
-            traceback.print_exc()
-
     # ==================== Autocomplete ====================
 
-    def show_path_autocomplete(self, partial_path: str):
-        """Show autocomplete suggestions for paths."""
+    async def show_path_autocomplete(self, partial_path: str):
+        """Show autocomplete suggestions for paths.
+
+        Cache misses are searched in a worker thread so typing stays
+        responsive while the directory answers.
+        """
         self.autocomplete_mode = True
 
+        path_parts = [p for p in _PATH_SEPARATOR.split(partial_path.strip()) if p]
         # Handle case where path ends with / - show all children
-        if partial_path.endswith("/"):
-            path_parts = [
-                p.strip() for p in partial_path.rstrip("/").split("/") if p.strip()
-            ]
+        if partial_path.endswith("/") or not path_parts:
             search_prefix = ""
         else:
-            path_parts = [p.strip() for p in partial_path.split("/") if p.strip()]
-            search_prefix = path_parts[-1].lower() if path_parts else ""
-            path_parts = path_parts[:-1]  # Remove last part for search base
+            search_prefix = path_parts.pop().lower()  # Last part filters names
 
         # Determine search base
         if path_parts:
@@ -843,7 +1241,17 @@ class ADTUI(App):
             search_base = self.base_dn
 
         try:
-            ous = self.ldap_service.search_ous(search_base, search_prefix, limit=50)
+            ous = self._cached_child_ous(search_base, search_prefix)
+            if ous is None:
+                loop = asyncio.get_running_loop()
+                ous = await loop.run_in_executor(
+                    None,
+                    self.ldap_service.search_ous,
+                    search_base,
+                    search_prefix,
+                    AUTOCOMPLETE_LIMIT,
+                )
+                self._cache_child_ous(search_base, search_prefix, ous)
 
             suggestions = []
             for ou in ous:
@@ -869,6 +1277,36 @@ class ADTUI(App):
         except Exception as e:
             pass
 
+    def _run_ldap(
+        self,
+        call: Callable,
+        *args,
+        on_done: Callable,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Run a blocking LDAP call in a worker thread.
+
+        Args:
+            call: Function to run, usually an LDAPService method
+            *args: Arguments for call
+            on_done: Receives the call's result on the UI thread
+            on_error: Receives any exception raised by call on the UI thread;
+                the exception is only logged if not given
+        """
+
+        def work():
+            try:
+                result = call(*args)
+            except Exception as e:
+                if on_error is None:
+                    logger.error("LDAP operation failed: %s", e)
+                else:
+                    self.call_from_thread(on_error, e)
+                return
+            self.call_from_thread(on_done, result)
+
+        self.run_worker(work, thread=True, group="ldap")
+
     # ==================== Delete Operations ====================
 
     def handle_delete_confirmation(self, confirmed: bool):
@@ -888,21 +1326,28 @@ class ADTUI(App):
             "delete", {"dn": dn, "label": self.current_selected_label}
         )
 
-        # Perform delete
-        success, message = self.ldap_service.delete_object(dn)
+        def done(result):
+            success, message = result
+            if success:
+                self.notify(message, severity=Severity.INFORMATION.value)
+                # Clear the selection if it is still the deleted object; the
+                # user may have selected another node while the delete ran
+                if self.current_selected_dn == dn:
+                    self.current_selected_dn = None
+                    self.current_selected_label = None
+                    self.current_selected_type = None
+                    # Clear the details pane
+                    if hasattr(self, "details") and self.details:
+                        self.details.update_content("No selection", None, None)
+                # Remove the deleted node from tree and select next appropriate node
+                self.adtree.remove_node_by_dn(dn)
+                self._ou_children_cache.clear()
+                self._forget_object(dn)
+            else:
+                self.notify(message, severity=Severity.ERROR.value)
 
-        if success:
-            self.notify(message, severity=Severity.INFORMATION.value)
-            # Clear current selection since the object was deleted
-            self.current_selected_dn = None
-            self.current_selected_label = None
-            # Clear the details pane
-            if hasattr(self, "details") and self.details:
-                self.details.update_content("No selection", None, None)
-            # Remove the deleted node from tree and select next appropriate node
-            self.adtree.remove_node_by_dn(dn)
-        else:
-            self.notify(message, severity=Severity.ERROR.value)
+        # Perform delete
+        self._run_ldap(self.ldap_service.delete_object, dn, on_done=done)
 
     # ==================== Move Operations ====================
 
@@ -919,29 +1364,36 @@ class ADTUI(App):
         """Move an AD object."""
         original_parent = self.path_service.get_parent_dn(dn)
 
-        success, message, new_dn = self.ldap_service.move_object(dn, target_ou)
-
-        if success:
-            self.notify(message, severity=Severity.INFORMATION.value)
+        def done(result):
+            success, message, new_dn = result
+            if success:
+                self.notify(message, severity=Severity.INFORMATION.value)
+
+                # Add to history
+                self.history_service.add(
+                    "move",
+                    {
+                        "object": self.path_service.get_rdn(dn),
+                        "original_parent": original_parent,
+                        "new_dn": new_dn,
+                    },
+                )
 
-            # Add to history
-            self.history_service.add(
-                "move",
-                {
-                    "object": self.path_service.get_rdn(dn),
-                    "original_parent": original_parent,
-                    "new_dn": new_dn,
-                },
-            )
+                self._forget_object(dn, new_dn)
+                # Follow the moved object only if it is still selected
+                if self.current_selected_dn == dn:
+                    self.current_selected_dn = new_dn
+                    if self.current_selected_label:
+                        self.details.update_content(
+                            self.current_selected_label,
+                            new_dn,
+                            self.connection_manager,
+                        )
+                self._schedule_refresh_ou()
+            else:
+                self.notify(message, severity=Severity.ERROR.value)
 
-            self.current_selected_dn = new_dn
-            if self.current_selected_label:
-                self.details.update_content(
-                    self.current_selected_label, new_dn, self.connection_manager
-                )
-            self.action_refresh_ou()
-        else:
-            self.notify(message, severity=Severity.ERROR.value)
+        self._run_ldap(self.ldap_service.move_object, dn, target_ou, on_done=done)
 
     # ==================== OU Creation ====================
 
@@ -959,14 +1411,24 @@ class ADTUI(App):
 
     def create_ou_in_parent(self, ou_name: str, parent_dn: str, description: str = ""):
         """Create a new OU in specified parent."""
-        success, message = self.ldap_service.create_ou(ou_name, parent_dn, description)
+        self._run_ldap(
+            self.ldap_service.create_ou,
+            ou_name,
+            parent_dn,
+            description,
+            on_done=lambda result: self._on_ou_created(ou_name, parent_dn, result),
+        )
 
+    def _on_ou_created(self, ou_name: str, parent_dn: str, result) -> None:
+        """Report an OU creation and record it for undo."""
+        success, message = result
         if success:
             self.notify(message, severity=Severity.INFORMATION.value)
-            self.history_service.add(
-                "create_ou", {"dn": f"ou={ou_name},{parent_dn}", "name": ou_name}
-            )
-            self.action_refresh_ou()
+            ou_dn = f"ou={ou_name},{parent_dn}"
+            self.history_service.add("create_ou", {"dn": ou_dn, "name": ou_name})
+            self._forget_ou_children(parent_dn)
+            if not self.adtree.add_node_under_dn(parent_dn, ou_dn, ou_name):
+                self._schedule_refresh_ou()
         else:
             self.notify(message, severity=Severity.ERROR.value)
 
@@ -976,16 +1438,13 @@ class ADTUI(App):
         ou_name = self.path_service.extract_ou_name_from_path(path)
         parent_dn = self.path_service.get_parent_dn(full_dn)
 
-        success, message = self.ldap_service.create_ou(ou_name, parent_dn, description)
-
-        if success:
-            self.notify(message, severity=Severity.INFORMATION.value)
-            self.history_service.add(
-                "create_ou", {"dn": f"ou={ou_name},{parent_dn}", "name": ou_name}
-            )
-            self.action_refresh_ou()
-        else:
-            self.notify(message, severity=Severity.ERROR.value)
+        self._run_ldap(
+            self.ldap_service.create_ou,
+            ou_name,
+            parent_dn,
+            description,
+            on_done=lambda result: self._on_ou_created(ou_name, parent_dn, result),
+        )
 
     # ==================== Restore Operations ====================
 
@@ -1000,11 +1459,21 @@ class ADTUI(App):
 
     def restore_object(self, deleted_dn: str):
         """Restore a deleted object."""
-        success, message = self.ldap_service.restore_object(deleted_dn)
 
+        def done(result):
+            # The DN the object comes back under is not known here
+            self.forget_user_checks()
+            self._clear_details()
+            self._on_ldap_result(result)
+
+        self._run_ldap(self.ldap_service.restore_object, deleted_dn, on_done=done)
+
+    def _on_ldap_result(self, result) -> None:
+        """Report a (success, message) result and refresh the tree on success."""
+        success, message = result
         if success:
             self.notify(message, severity=Severity.INFORMATION.value)
-            self.action_refresh_ou()
+            self._schedule_refresh_ou()
         else:
             self.notify(message, severity=Severity.ERROR.value)
 
@@ -1013,82 +1482,82 @@ class ADTUI(App):
     def undo_create_ou(self, operation):
         """Undo OU creation."""
         ou_dn = operation.details["dn"]
-        success, message = self.ldap_service.delete_object(ou_dn)
 
-        if success:
-            self.notify(MESSAGES["UNDO_SUCCESS"], severity=Severity.INFORMATION.value)
-            self.history_service.pop_last()
-            self.action_refresh_ou()
-        else:
-            self.notify(f"Failed to undo: {message}", severity=Severity.ERROR.value)
+        def done(result):
+            self._forget_object(ou_dn)
+            self._on_undo_result(result)
+
+        self._run_ldap(self.ldap_service.delete_object, ou_dn, on_done=done)
 
     def undo_move(self, operation):
         """Undo move operation."""
         current_dn = operation.details["new_dn"]
         original_parent = operation.details["original_parent"]
 
-        success, message, _ = self.ldap_service.move_object(current_dn, original_parent)
+        def done(result):
+            self._forget_object(current_dn, result[2])
+            self._on_undo_result(result[:2])
+
+        self._run_ldap(
+            self.ldap_service.move_object, current_dn, original_parent, on_done=done
+        )
 
+    def _on_undo_result(self, result) -> None:
+        """Report an undo and drop it from history on success."""
+        success, message = result
         if success:
             self.notify(MESSAGES["UNDO_SUCCESS"], severity=Severity.INFORMATION.value)
             self.history_service.pop_last()
-            self.action_refresh_ou()
+            self._schedule_refresh_ou()
         else:
             self.notify(f"Failed to undo: {message}", severity=Severity.ERROR.value)
 
     def handle_unlock_confirmation(self, confirmed: bool):
         """Handle unlock confirmation result."""
         if confirmed and self.current_selected_dn:
-            try:
-                success, message = self.ldap_service.unlock_user_account(
-                    self.current_selected_dn
-                )
-                if success:
-                    self.notify(message, severity=Severity.INFORMATION.value)
-                    # Refresh the current view
-                    self.refresh_current_view()
-                else:
-                    self.notify(message, severity=Severity.ERROR.value)
-            except Exception as e:
-                self.notify(
+            self._run_ldap(
+                self.ldap_service.unlock_user_account,
+                self.current_selected_dn,
+                on_done=partial(self._on_account_change, self.current_selected_dn),
+                on_error=lambda e: self.notify(
                     f"Error unlocking account: {e}", severity=Severity.ERROR.value
-                )
+                ),
+            )
 
     def handle_enable_confirmation(self, confirmed: bool):
         """Handle enable confirmation result."""
         if confirmed and self.current_selected_dn:
-            try:
-                success, message = self.ldap_service.enable_user_account(
-                    self.current_selected_dn
-                )
-                if success:
-                    self.notify(message, severity=Severity.INFORMATION.value)
-                    # Refresh the current view
-                    self.refresh_current_view()
-                else:
-                    self.notify(message, severity=Severity.ERROR.value)
-            except Exception as e:
-                self.notify(
+            self._run_ldap(
+                self.ldap_service.enable_user_account,
+                self.current_selected_dn,
+                on_done=partial(self._on_account_change, self.current_selected_dn),
+                on_error=lambda e: self.notify(
                     f"Error enabling account: {e}", severity=Severity.ERROR.value
-                )
+                ),
+            )
 
     def handle_disable_confirmation(self, confirmed: bool):
         """Handle disable confirmation result."""
         if confirmed and self.current_selected_dn:
-            try:
-                success, message = self.ldap_service.disable_user_account(
-                    self.current_selected_dn
-                )
-                if success:
-                    self.notify(message, severity=Severity.INFORMATION.value)
-                    # Refresh the current view
-                    self.refresh_current_view()
-                else:
-                    self.notify(message, severity=Severity.ERROR.value)
-            except Exception as e:
-                self.notify(
+            self._run_ldap(
+                self.ldap_service.disable_user_account,
+                self.current_selected_dn,
+                on_done=partial(self._on_account_change, self.current_selected_dn),
+                on_error=lambda e: self.notify(
                     f"Error disabling account: {e}", severity=Severity.ERROR.value
-                )
+                ),
+            )
+
+    def _on_account_change(self, dn: str, result) -> None:
+        """Report an account state change and refresh the current view."""
+        success, message = result
+        if success:
+            self.forget_details(dn)
+            self.notify(message, severity=Severity.INFORMATION.value)
+            # Refresh the current view
+            self.refresh_current_view()
+        else:
+            self.notify(message, severity=Severity.ERROR.value)
 
     def handle_create_user_confirmation(self, result):
         """Handle create user confirmation result."""
@@ -1103,11 +1572,7 @@ class ADTUI(App):
                 },
             )
 
-            # Refresh tree to show new user
-            self.action_refresh_ou()
-
-            # Navigate to and select new user
-            self.set_timer(0.5, lambda: self.expand_tree_to_dn(result["user_dn"]))
+            self._show_new_user(result["user_dn"], result["full_name"])
         elif result:
             # User cancelled dialog
             pass
@@ -1125,61 +1590,81 @@ class ADTUI(App):
                 },
             )
 
-            # Refresh tree to show new user
-            self.action_refresh_ou()
-
-            # Navigate to and select new user
-            self.set_timer(0.5, lambda: self.expand_tree_to_dn(result["user_dn"]))
+            self._show_new_user(result["user_dn"], result["full_name"])
         elif result:
             # User cancelled dialog
             pass
 
+    def _show_new_user(self, user_dn: str, full_name: str) -> None:
+        """Add a created user to the tree, then navigate to and select it."""
+        self._forget_object(user_dn)
+        parent_dn = self.path_service.get_parent_dn(user_dn)
+        if self.adtree.add_node_under_dn(parent_dn, user_dn, full_name, is_ou=False):
+            self.call_after_refresh(self.expand_tree_to_dn, user_dn)
+        else:
+            # Parent not in the tree: reload the current OU instead
+            self._schedule_refresh_ou(then=partial(self.expand_tree_to_dn, user_dn))
+
     def undo_create_user(self, operation):
         """Undo create user operation."""
-        try:
-            user_dn = operation.details["user_dn"]
-            success, message = self.ldap_service.delete_object(user_dn)
+        user_dn = operation.details["user_dn"]
+        full_name = operation.details["full_name"]
 
+        def done(result):
+            success, message = result
             if success:
                 self.notify(
-                    f"Undid: Created user {operation.details['full_name']}",
+                    f"Undid: Created user {full_name}",
                     severity=Severity.INFORMATION.value,
                 )
-                self.action_refresh_ou()
+                self._forget_object(user_dn)
+                self._schedule_refresh_ou()
             else:
                 self.notify(
                     f"Failed to undo create user: {message}",
                     severity=Severity.ERROR.value,
                 )
-        except Exception as e:
-            self.notify(
+
+        self._run_ldap(
+            self.ldap_service.delete_object,
+            user_dn,
+            on_done=done,
+            on_error=lambda e: self.notify(
                 f"Error undoing create user: {e}", severity=Severity.ERROR.value
-            )
+            ),
+        )
 
     def undo_copy_user(self, operation):
         """Undo copy user operation."""
-        try:
-            user_dn = operation.details["user_dn"]
-            success, message = self.ldap_service.delete_object(user_dn)
+        user_dn = operation.details["user_dn"]
+        full_name = operation.details["full_name"]
 
+        def done(result):
+            success, message = result
             if success:
                 self.notify(
-                    f"Undid: Copied user {operation.details['full_name']}",
+                    f"Undid: Copied user {full_name}",
                     severity=Severity.INFORMATION.value,
                 )
-                self.action_refresh_ou()
+                self._forget_object(user_dn)
+                self._schedule_refresh_ou()
             else:
                 self.notify(
                     f"Failed to undo copy user: {message}",
                     severity=Severity.ERROR.value,
                 )
-        except Exception as e:
-            self.notify(f"Error undoing copy user: {e}", severity=Severity.ERROR.value)
+
+        self._run_ldap(
+            self.ldap_service.delete_object,
+            user_dn,
+            on_done=done,
+            on_error=lambda e: self.notify(
+                f"Error undoing copy user: {e}", severity=Severity.ERROR.value
+            ),
+        )
 
     def action_create_user(self):
         """Create new user account."""
-        from .ui.dialogs import CreateUserDialog
-
         # Use current selected OU or base DN
         target_ou = self._get_current_ou()
         if not target_ou:
@@ -1192,33 +1677,30 @@ class ADTUI(App):
 
     def action_copy_user(self):
         """Copy existing user account."""
-        from .ui.dialogs import CopyUserDialog
-
         if not self.current_selected_dn:
             self.notify("No user selected to copy", severity=Severity.WARNING.value)
             return
 
-        # Check if selected object is a user
-        if not self._is_user_object(self.current_selected_dn):
-            self.notify(
-                "Selected object is not a user", severity=Severity.WARNING.value
-            )
-            return
-
+        source_dn = self.current_selected_dn
+        source_label = self.current_selected_label or ""
         # Use current selected OU as target
         target_ou = self._get_current_ou()
         if not target_ou:
             target_ou = self.ldap_service.base_dn if self.ldap_service else self.base_dn
 
-        self.push_screen(
-            CopyUserDialog(
-                self.current_selected_dn,
-                str(self.current_selected_label) if self.current_selected_label else "",
-                target_ou,
-                self.ldap_service,
-            ),
-            self.handle_copy_user_confirmation,
-        )
+        def checked(is_user: bool):
+            if not is_user:
+                self.notify(
+                    "Selected object is not a user", severity=Severity.WARNING.value
+                )
+                return
+            self.push_screen(
+                CopyUserDialog(source_dn, source_label, target_ou, self.ldap_service),
+                self.handle_copy_user_confirmation,
+            )
+
+        # Check if selected object is a user
+        self._run_ldap(self._is_user_object, source_dn, on_done=checked)
 
     def action_copy_to_clipboard(self):
         """Copy selected text or object DN to clipboard."""
@@ -1256,563 +1738,265 @@ class ADTUI(App):
                 self.connection_manager.close()
             except Exception:
                 pass
-            self.connection_manager = None
+        self._reset_session()
+
+        if self.config_service is not None:
+            # Clear the UI and show domain selection or login again
+            self._clear_ui()
+            self._start_login()
+            return
 
         # Signal that we need to restart login flow
         self.auth_failed = True
         self.exit()
 
     def _copy_to_system_clipboard(self, text: str, description: str):
-        """Copy text to system clipboard with cross-platform support."""
-        try:
-            # Strip ANSI escape codes for clean copy
-            import re
+        """Copy text to system clipboard with cross-platform support.
 
-            ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-            clean_text = ansi_escape.sub("", text)
+        The text goes to the terminal through OSC 52 and, when one is
+        installed, to the platform clipboard tool as well.
+        """
+        # Strip ANSI escape codes for clean copy
+        clean_text = _ANSI_ESCAPE.sub("", text)
+
+        # Remove excessive whitespace but keep newlines
+        clean_text = "\n".join(
+            line.strip() for line in clean_text.split("\n") if line.strip()
+        )
 
-            # Remove excessive whitespace but keep newlines
-            clean_text = "\n".join(
-                line.strip() for line in clean_text.split("\n") if line.strip()
+        # Truncate long content for notification
+        display_text = clean_text[:50] + "..." if len(clean_text) > 50 else clean_text
+
+        # OSC 52: the terminal sets its clipboard itself, which also works
+        # over SSH, without spawning anything
+        self.copy_to_clipboard(clean_text)
+
+        command = PlatformService.get_clipboard_command()
+        if command is None:
+            self.notify(
+                f"Copied {description} to terminal clipboard: {display_text}",
+                severity="information",
             )
+            return
 
-            # Try different clipboard commands based on OS
-            if sys.platform == "linux":
-                # Try wl-copy first (Wayland), then xclip (X11)
-                for cmd in ["wl-copy", "xclip -selection clipboard"]:
-                    try:
-                        subprocess.run(
-                            cmd,
-                            input=clean_text,
-                            text=True,
-                            check=True,
-                            shell=True,
-                            capture_output=True,
-                        )
-                        # Truncate long content for notification
-                        display_text = (
-                            clean_text[:50] + "..."
-                            if len(clean_text) > 50
-                            else clean_text
-                        )
-                        self.notify(
-                            f"Copied {description}: {display_text}",
-                            severity="information",
-                        )
-                        return
-                    except (subprocess.CalledProcessError, FileNotFoundError):
-                        continue
-                # If neither works, try pbcopy (might be available)
-                try:
-                    subprocess.run(["pbcopy"], input=clean_text, text=True, check=True)
-                    display_text = (
-                        clean_text[:50] + "..." if len(clean_text) > 50 else clean_text
-                    )
-                    self.notify(
-                        f"Copied {description}: {display_text}", severity="information"
-                    )
-                    return
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    pass
-            elif sys.platform == "darwin":
-                subprocess.run(["pbcopy"], input=clean_text, text=True, check=True)
-                display_text = (
-                    clean_text[:50] + "..." if len(clean_text) > 50 else clean_text
-                )
-                self.notify(
-                    f"Copied {description}: {display_text}", severity="information"
-                )
-                return
-            elif sys.platform == "win32":
+        def copy():
+            try:
                 subprocess.run(
-                    ["clip"], input=clean_text, text=True, check=True, shell=True
-                )
-                display_text = (
-                    clean_text[:50] + "..." if len(clean_text) > 50 else clean_text
+                    command,
+                    input=clean_text,
+                    text=True,
+                    check=True,
+                    capture_output=True,
                 )
-                self.notify(
-                    f"Copied {description}: {display_text}", severity="information"
+            except (subprocess.CalledProcessError, OSError) as e:
+                self.call_from_thread(
+                    self.notify, f"Failed to copy to clipboard: {e}", severity="error"
                 )
                 return
-
-            # If we get here, clipboard commands failed
-            self.notify(
-                "Clipboard not available. Install xclip or wl-copy on Linux.",
-                severity="warning",
+            self.call_from_thread(
+                self.notify,
+                f"Copied {description}: {display_text}",
+                severity="information",
             )
 
-        except Exception as e:
-            self.notify(f"Failed to copy to clipboard: {e}", severity="error")
+        # The helper is a separate process; don't block the UI on it
+        self.run_worker(copy, thread=True, group="clipboard")
 
     def _get_current_ou(self) -> str:
         """Get currently selected OU DN."""
         if self.current_selected_dn:
             # Check if current selection is an OU
-            if self.current_selected_label and "📁" in str(self.current_selected_label):
+            if self.current_selected_type is ObjectType.OU:
                 return self.current_selected_dn
-            else:
+            elif self.path_service:
                 # Get parent OU of selected object
-                dn_parts = self.current_selected_dn.split(",")
-                if len(dn_parts) > 1:
-                    return ",".join(dn_parts[1:])
+                return self.path_service.get_parent_dn(self.current_selected_dn)
 
         # Fallback to base DN
         return self.ldap_service.base_dn if self.ldap_service else self.base_dn
 
     def _is_user_object(self, dn: str) -> bool:
-        """Check if DN represents a user object."""
-        try:
-            self.ldap_service.conn.search(
-                dn, "(objectClass=*)", search_scope="BASE", attributes=["objectClass"]
-            )
-            if self.ldap_service.conn.entries:
-                obj_classes = [
-                    str(cls).lower()
-                    for cls in self.ldap_service.conn.entries[0].objectClass
-                ]
+        """Check if DN represents a user object.
+
+        Objects loaded in the tree are answered from the classes it fetched.
+        Other answers are cached per DN, including negative ones, until the
+        object is deleted, moved or created. Safe to call from any thread.
+        A DN that is neither cached nor in the tree costs a directory search,
+        so prefer a worker thread unless the DN is the tree selection.
+        """
+        key = dn.lower()
+        with self._is_user_lock:
+            cached = self._is_user_cache.get(key)
+            if cached is not None:
+                self._is_user_cache.move_to_end(key)
+                return cached
+        # Objects listed in the tree already had their classes fetched
+        obj_classes = self.adtree.get_object_classes(dn)
+        if obj_classes is not None:
+            return "user" in obj_classes and "computer" not in obj_classes
+        if self.connection_manager is None:
+            return False
+
+        def check_op(conn):
+            try:
+                conn.search(
+                    dn,
+                    "(objectClass=*)",
+                    search_scope="BASE",
+                    attributes=["objectClass"],
+                )
+            except LDAPNoSuchObjectResult:
+                return False
+            if conn.entries:
+                obj_classes = {str(cls).lower() for cls in conn.entries[0].objectClass}
                 return "user" in obj_classes and "computer" not in obj_classes
             return False
+
+        try:
+            is_user = self.connection_manager.execute_with_retry(check_op)
         except Exception as e:
             logger.debug("Error checking if object is user: %s", e)
             return False
 
-    def refresh_current_view(self):
-        """Refresh the currently displayed view."""
-        if hasattr(self.details, "current_widget") and self.details.current_widget:
-            # Refresh user details if showing
-            if hasattr(self.details.current_widget, "load_user_details"):
-                self.details.current_widget.load_user_details()
-        else:
-            # Otherwise refresh the tree
-            self.action_refresh_ou()
-
-
-def run_setup_wizard() -> bool:
-    """Run the interactive setup wizard to create config file.
-
-    Returns:
-        True if config was created successfully, False otherwise
-    """
-    import os
-    from pathlib import Path
-    from .services.platform_service import PlatformService
-
-    config_dir = PlatformService.get_config_dir()
-    config_file = config_dir / "config.ini"
-
-    print("\n" + "=" * 60)
-    print("   ADTUI - Active Directory Configuration Wizard")
-    print("=" * 60 + "\n")
-
-    if config_file.exists():
-        print(f"Configuration file already exists at: {config_file}")
-        response = input("Do you want to reconfigure? [y/N]: ").strip().lower()
-        if response != "y":
-            print("Keeping existing configuration.")
-            return True
-        # Backup existing config
-        import shutil
-        from datetime import datetime
-
-        backup_name = f"config.ini.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        shutil.copy(config_file, config_dir / backup_name)
-        print(f"Existing config backed up to: {backup_name}")
-
-    # Create config directory
-    config_dir.mkdir(parents=True, exist_ok=True)
-
-    domains = []
-    ad_configs = []
-
-    while True:
-        print(f"\n--- Active Directory #{len(domains) + 1} ---\n")
-
-        # Domain name
-        domain_name = input("Domain short name (e.g., CORP, DOMMAN): ").strip().upper()
-        if not domain_name:
-            print("Domain name cannot be empty.")
-            continue
-
-        # Server
-        server = input("AD Server hostname (e.g., dc1.domain.com): ").strip()
-        if not server:
-            print("Server cannot be empty.")
-            continue
-
-        # Auto-detect base_dn from server name
-        default_base_dn = ""
-        if "." in server:
-            parts = server.split(".")[1:]  # Skip hostname, keep domain parts
-            default_base_dn = ",".join(f"DC={p}" for p in parts)
-
-        if default_base_dn:
-            base_dn = input(f"Base DN [{default_base_dn}]: ").strip()
-            if not base_dn:
-                base_dn = default_base_dn
-        else:
-            base_dn = input("Base DN (e.g., DC=domain,DC=com): ").strip()
-            if not base_dn:
-                print("Base DN cannot be empty.")
-                continue
-
-        # SSL
-        use_ssl = input("Use SSL/TLS? [y/N]: ").strip().lower() == "y"
-
-        domains.append(domain_name)
-        ad_configs.append(
-            {
-                "domain": domain_name,
-                "server": server,
-                "base_dn": base_dn,
-                "use_ssl": use_ssl,
-            }
+        with self._is_user_lock:
+            self._is_user_cache[key] = is_user
+            while len(self._is_user_cache) > USER_CHECK_CACHE_SIZE:
+                self._is_user_cache.popitem(last=False)
+        return is_user
+
+    def forget_user_checks(self, *dns: str) -> None:
+        """Drop cached _is_user_object answers for DNs, or all of them."""
+        with self._is_user_lock:
+            if not dns:
+                self._is_user_cache.clear()
+            for dn in dns:
+                self._is_user_cache.pop(dn.lower(), None)
+
+    def get_cached_details(self, dn: str) -> Optional[Any]:
+        """Get the entry of an object the details pane showed recently.
+
+        Returns:
+            The cached ldap3 entry, or None if it has to be fetched
+        """
+        key = dn.lower()
+        cached = self._detail_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= DETAILS_CACHE_TTL:
+            del self._detail_cache[key]
+            return None
+        self._detail_cache.move_to_end(key)
+        return cached[1]
+
+    def remember_details(self, dn: str, entry: Any) -> None:
+        """Cache an entry fetched for the details pane, evicting the least recently used."""
+        key = dn.lower()
+        self._detail_cache[key] = (time.monotonic(), entry)
+        self._detail_cache.move_to_end(key)
+        while len(self._detail_cache) > DETAILS_CACHE_SIZE:
+            self._detail_cache.popitem(last=False)
+
+    def _clear_details(self) -> None:
+        """Drop every cached details entry, including prefetches in flight."""
+        self._detail_cache.clear()
+        self._detail_generation += 1
+
+    def _prefetch_details(self, node) -> None:
+        """Fetch the details of the objects around a selected tree node.
+
+        The siblings are searched for in one request, so moving through an
+        OU shows them from the details cache.
+        """
+        parent = node.parent
+        if parent is None or parent.data is None or self.connection_manager is None:
+            return
+        siblings = [child.data for child in parent.children if child.data]
+        try:
+            index = siblings.index(node.data)
+        except ValueError:
+            return
+        start = max(0, index - DETAILS_PREFETCH_COUNT // 2)
+        dns = [
+            dn
+            for dn in siblings[start : start + DETAILS_PREFETCH_COUNT]
+            if dn != node.data and self.get_cached_details(dn) is None
+        ]
+        if not dns:
+            return
+        self.run_worker(
+            partial(self._prefetch_details_worker, parent.data, dns),
+            thread=True,
+            group="prefetch-details",
+            exclusive=True,
         )
 
-        print(f"\n[OK] Added {domain_name} configuration")
-
-        # Ask for another AD
-        add_another = input("\nAdd another Active Directory? [y/N]: ").strip().lower()
-        if add_another != "y":
-            break
+    def _prefetch_details_worker(self, parent_dn: str, dns: List[str]) -> None:
+        """Search a batch of sibling objects and cache them on the UI thread."""
+        generation = self._detail_generation
+        search_filter = "(|{})".format(
+            "".join(f"(distinguishedName={escape_filter_chars(dn)})" for dn in dns)
+        )
 
-    # Write config file
-    try:
-        with open(config_file, "w") as f:
-            f.write("# ADTUI Configuration\n")
-            f.write("# Generated by setup wizard\n\n")
-            f.write("[ad_domains]\n")
-            f.write(f"domains = {', '.join(domains)}\n")
-
-            for cfg in ad_configs:
-                f.write(f"\n[ad_{cfg['domain']}]\n")
-                f.write(f"server = {cfg['server']}\n")
-                f.write(f"domain = {cfg['domain']}\n")
-                f.write(f"base_dn = {cfg['base_dn']}\n")
-                f.write(f"use_ssl = {'true' if cfg['use_ssl'] else 'false'}\n")
-                f.write("max_retries = 5\n")
-                f.write("initial_retry_delay = 1.0\n")
-                f.write("max_retry_delay = 60.0\n")
-                f.write("health_check_interval = 30.0\n")
-
-            # Add legacy [ldap] section for backward compatibility
-            first = ad_configs[0]
-            f.write("\n# Legacy single AD support (for backward compatibility)\n")
-            f.write("[ldap]\n")
-            f.write(f"server = {first['server']}\n")
-            f.write(f"domain = {first['domain']}\n")
-            f.write(f"base_dn = {first['base_dn']}\n")
-            f.write(f"use_ssl = {'true' if first['use_ssl'] else 'false'}\n")
-            f.write("max_retries = 5\n")
-            f.write("initial_retry_delay = 1.0\n")
-            f.write("max_retry_delay = 60.0\n")
-            f.write("health_check_interval = 30.0\n")
-
-        print(f"\n[OK] Configuration saved to: {config_file}")
-        if len(domains) > 1:
-            print(
-                f"[OK] Configured {len(domains)} Active Directory domains: {', '.join(domains)}"
+        def search_op(conn):
+            conn.search(
+                parent_dn,
+                search_filter,
+                search_scope="LEVEL",
+                attributes=["*"],
+                size_limit=len(dns),
             )
-        print()
-        return True
-
-    except Exception as e:
-        print(f"\n[ERROR] Failed to save configuration: {e}")
-        return False
-
-
-def _run_update(check_only: bool = False, quiet: bool = False) -> bool:
-    """Run update check and optionally perform update.
-
-    Args:
-        check_only: If True, only check for updates without installing
-        quiet: If True, suppress output unless update is available
-
-    Returns:
-        True if update was performed successfully or no update needed
-    """
-    from .services.update_service import UpdateService
-
-    update_service = UpdateService()
-
-    if not quiet:
-        print("Checking for updates...")
-
-    result = update_service.check_for_update(force=True)
-
-    if result.error:
-        if not quiet:
-            print(f"Error checking for updates: {result.error}")
-        return False
-
-    if not result.update_available:
-        if not quiet:
-            print(f"ADTUI {result.current_version} is up to date.")
-        return True
-
-    print(f"Update available: {result.current_version} -> {result.latest_version}")
-
-    if check_only:
-        return True
+            return list(conn.entries)
 
-    print("Installing update...")
-    success, message = update_service.perform_update()
-
-    if success:
-        print(f"Update successful: {message}")
-        print("Please restart ADTUI to use the new version.")
-    else:
-        print(f"Update failed: {message}")
-
-    return success
-
-
-def main():
-    """Main entry point for application."""
-    import argparse
-    import os
-    from pathlib import Path
-
-    from . import __version__
-
-    # Parse command-line arguments before starting Textual
-    parser = argparse.ArgumentParser(
-        description="ADTUI - Active Directory Terminal User Interface"
-    )
-    parser.add_argument(
-        "--version", "-V",
-        action="version",
-        version=f"adtui {__version__}"
-    )
-    parser.add_argument(
-        "--update", "-u",
-        action="store_true",
-        help="Check for updates and install if available, then exit"
-    )
-    parser.add_argument(
-        "--check-update",
-        action="store_true",
-        help="Check for updates without installing, then exit"
-    )
-    parser.add_argument(
-        "--no-auto-update",
-        action="store_true",
-        help="Skip automatic update check and installation at startup"
-    )
-    args = parser.parse_args()
-
-    # Handle update flags
-    if args.update:
-        _run_update(check_only=False)
-        return
-
-    if args.check_update:
-        _run_update(check_only=True)
-        return
-
-    # Auto-update before launching (default behavior)
-    if not args.no_auto_update:
         try:
-            from .services.update_service import UpdateService
-            update_service = UpdateService()
-            # Force fresh check, don't use cache for startup auto-update
-            result = update_service.check_for_update(force=True)
-
-            if result.update_available:
-                print(f"Update available: {result.current_version} -> {result.latest_version}")
-                print("Installing update...")
-
-                success, message = update_service.perform_update()
-                if success:
-                    print(f"Update successful: {message}")
-                    print("Restarting ADTUI with new version...\n")
-
-                    # Restart the application with the new version
-                    import sys
-                    import os
-                    # Use --no-auto-update to prevent infinite update loop
-                    os.execv(sys.executable, [sys.executable, "-m", "adtui", "--no-auto-update"])
-                else:
-                    print(f"Auto-update failed: {message}")
-                    print("Continuing with current version...\n")
+            entries = self.connection_manager.execute_with_retry(search_op)
         except Exception as e:
-            # Silently continue if update check fails
-            pass
-
-    # Check if config exists, if not run wizard
-    from .services.platform_service import PlatformService
-
-    config_paths = [
-        PlatformService.get_config_dir() / "config.ini",
-        Path.cwd() / "config.ini",
-    ]
-    # Add legacy Unix path only on non-Windows
-    legacy_path = PlatformService.get_legacy_config_path("config.ini")
-    if legacy_path:
-        config_paths.insert(1, legacy_path)
-
-    config_exists = any(p.exists() for p in config_paths)
-
-    if not config_exists:
-        print("No configuration file found.")
-        if not run_setup_wizard():
+            logger.debug("Error prefetching details under %s: %s", parent_dn, e)
             return
+        self.call_from_thread(self._store_prefetched, generation, entries)
 
-    # Load configuration
-    try:
-        config_service = ConfigService()
-    except FileNotFoundError:
-        # Config still not found, offer to run wizard
-        response = (
-            input("Would you like to run the setup wizard? [Y/n]: ").strip().lower()
-        )
-        if response != "n":
-            if not run_setup_wizard():
-                return
-            # Try loading again
-            try:
-                config_service = ConfigService()
-            except Exception as e:
-                print(f"Failed to load configuration: {e}")
-                return
-        else:
+    def _store_prefetched(self, generation: int, entries: List[Any]) -> None:
+        """Cache prefetched entries unless the cache was cleared meanwhile."""
+        if generation != self._detail_generation:
             return
-    except Exception as e:
-        print(f"Error loading configuration: {e}")
-        return
-
-    # Validate configuration
-    is_valid, issues = config_service.validate_config()
-    if not is_valid:
-        logger.error("Configuration errors:")
-        for issue in issues:
-            logger.error("  - %s", issue)
-        return
-
-    # Main loop to allow restarting login on auth failure
-    while True:
-        # Global variables to store login results
-        selected_domain = None
-        login_credentials = None
-        user_cancelled = False
-
-        # Create a simple app for the login flow
-        class LoginFlowApp(App):
-            CSS = """
-            Screen {
-                layout: grid;
-                grid-size: 1 1;
-                background: $background;
-            }
-            
-            Static {
-                text-align: center;
-                content-align: center middle;
-            }
-            """
-
-            def compose(self) -> ComposeResult:
-                ascii_art = f"""[bold cyan]┏━┃┏━   ━┏┛┃ ┃┛[/bold cyan]
-[blue]  ┏━┃┃ ┃   ┃ ┃ ┃┃[/blue]
-[dark_blue]┛ ┛━━    ┛ ━━┛┛[/dark_blue]
-              [dim]v{__version__}[/dim]"""
-
-                yield Static(
-                    f"{ascii_art}\n\n[bold cyan]Active Directory TUI[/bold cyan]\n"
-                )
-
-            def on_mount(self) -> None:
-                nonlocal selected_domain, login_credentials
-
-                # Check if we need to show AD selection dialog
-                if config_service.has_multiple_domains():
-                    # Show AD selection dialog first
-                    self.push_screen(
-                        ADSelectionDialog(config_service.ad_configs),
-                        self.handle_ad_selection,
-                    )
-                else:
-                    # Skip AD selection, use the default domain
-                    selected_domain = config_service.get_default_domain()
-                    self.show_login_dialog()
-
-            def handle_ad_selection(self, domain):
-                """Handle AD domain selection."""
-                nonlocal selected_domain, user_cancelled
-                if domain:
-                    selected_domain = domain
-                    self.show_login_dialog()
-                else:
-                    user_cancelled = True
-                    self.exit()
-
-            def show_login_dialog(self):
-                """Show the login dialog."""
-                nonlocal login_credentials
-                ad_config = config_service.get_config(selected_domain)
-                self.push_screen(
-                    LoginDialog(last_user, ad_config.domain), self.handle_login_result
-                )
-
-            def handle_login_result(self, result):
-                """Handle login result."""
-                nonlocal login_credentials, user_cancelled
-                if result:
-                    username, password = result
-
-                    # Save username to file
-                    with open(LAST_USER_FILE, "w") as f:
-                        f.write(username)
-
-                    # Store credentials and exit login app
-                    login_credentials = (username, password)
-                    self.exit()
-                else:
-                    user_cancelled = True
-                    self.exit()
-
-            def on_key(self, event) -> None:
-                nonlocal user_cancelled
-                if event.key == "escape":
-                    user_cancelled = True
-                    self.exit()
+        for entry in entries:
+            self.remember_details(entry.entry_dn, entry)
 
-        # Run login flow app first
-        login_app = LoginFlowApp()
-        login_app.run()
+    def forget_details(self, *dns: str) -> None:
+        """Drop the cached details entries of objects that were modified.
 
-        # If user cancelled (escape or cancel button), exit completely
-        if user_cancelled:
-            return
+        Prefetches in flight are discarded too, as they may have read the
+        objects before the change.
+        """
+        for dn in dns:
+            self._detail_cache.pop(dn.lower(), None)
+        self._detail_generation += 1
 
-        # After login app exits, check if we have credentials and start main app
-        if login_credentials and selected_domain:
-            # Clear the screen immediately to minimize CLI gap
-            os.system("cls" if os.name == "nt" else "clear")
+    def _forget_object(self, *dns: str) -> None:
+        """Drop cached state for DNs that were created, moved or deleted.
 
-            username, password = login_credentials
-            ad_config = config_service.get_config(selected_domain)
+        Group memberships naming these objects change along with them, so
+        every cached details entry is dropped, not only theirs.
+        """
+        dns = tuple(dn for dn in dns if dn)
+        if dns:
+            self.forget_user_checks(*dns)
+        for dn in dns:
+            self.adtree.forget_object_classes(dn)
+        self._clear_details()
 
-            try:
-                # Create and run the main app with credentials and AD config
-                app = ADTUI(username, password, ad_config)
-                app.run()
-
-                # Check if app exited due to auth failure or logout (should restart login)
-                # If app.auth_failed is True, continue loop to show login again
-                if getattr(app, "auth_failed", False):
-                    # Clear screen before restarting login
-                    os.system("cls" if os.name == "nt" else "clear")
-                    continue
-                else:
-                    # Normal exit - break the loop
-                    break
-            except Exception as e:
-                logger.error("Error running application: %s", e)
-                break
+    def refresh_current_view(self):
+        """Refresh the currently displayed view."""
+        widget = getattr(self.details, "current_widget", None)
+        # Refresh user details if showing
+        loader = getattr(widget, "load_user_details", None) if widget else None
+        if loader:
+            loader()
         else:
-            # No credentials provided, exit
-            return
+            # Otherwise refresh the tree
+            self._schedule_refresh_ou()
 
 
 if __name__ == "__main__":
+    from .cli import main
+
     main()
@@ -0,0 +1,336 @@
+"""Command-line entry point for ADTUI.
+
+Kept free of Textual and ldap3 imports so that --version, --help and the
+update flags return without loading the TUI.
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import NoReturn
+
+from . import __version__
+from .services.config_service import ConfigService
+from .services.platform_service import PlatformService
+from .services.update_service import UpdateService
+
+logger = logging.getLogger(__name__)
+
+
+def run_setup_wizard() -> bool:
+    """Run the interactive setup wizard to create config file.
+
+    Returns:
+        True if config was created successfully, False otherwise
+    """
+
+    config_dir = PlatformService.get_config_dir()
+    config_file = config_dir / "config.ini"
+
+    print("\n" + "=" * 60)
+    print("   ADTUI - Active Directory Configuration Wizard")
+    print("=" * 60 + "\n")
+
+    if config_file.exists():
+        print(f"Configuration file already exists at: {config_file}")
+        response = input("Do you want to reconfigure? [y/N]: ").strip().lower()
+        if response != "y":
+            print("Keeping existing configuration.")
+            return True
+        # Backup existing config
+        backup_name = f"config.ini.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        shutil.copy(config_file, config_dir / backup_name)
+        print(f"Existing config backed up to: {backup_name}")
+
+    # Create config directory
+    config_dir.mkdir(parents=True, exist_ok=True)
+
+    domains = []
+    ad_configs = []
+
+    while True:
+        print(f"\n--- Active Directory #{len(domains) + 1} ---\n")
+
+        # Domain name
+        domain_name = input("Domain short name (e.g., CORP, DOMMAN): ").strip().upper()
+        if not domain_name:
+            print("Domain name cannot be empty.")
+            continue
+
+        # Server
+        server = input("AD Server hostname (e.g., dc1.domain.com): ").strip()
+        if not server:
+            print("Server cannot be empty.")
+            continue
+
+        # Auto-detect base_dn from server name
+        default_base_dn = ""
+        if "." in server:
+            parts = server.split(".")[1:]  # Skip hostname, keep domain parts
+            default_base_dn = ",".join(f"DC={p}" for p in parts)
+
+        if default_base_dn:
+            base_dn = input(f"Base DN [{default_base_dn}]: ").strip()
+            if not base_dn:
+                base_dn = default_base_dn
+        else:
+            base_dn = input("Base DN (e.g., DC=domain,DC=com): ").strip()
+            if not base_dn:
+                print("Base DN cannot be empty.")
+                continue
+
+        # SSL
+        use_ssl = input("Use SSL/TLS? [y/N]: ").strip().lower() == "y"
+
+        domains.append(domain_name)
+        ad_configs.append(
+            {
+                "domain": domain_name,
+                "server": server,
+                "base_dn": base_dn,
+                "use_ssl": use_ssl,
+            }
+        )
+
+        print(f"\n[OK] Added {domain_name} configuration")
+
+        # Ask for another AD
+        add_another = input("\nAdd another Active Directory? [y/N]: ").strip().lower()
+        if add_another != "y":
+            break
+
+    # Write config file
+    try:
+        lines = [
+            "# ADTUI Configuration\n",
+            "# Generated by setup wizard\n\n",
+            "[ad_domains]\n",
+            f"domains = {', '.join(domains)}\n",
+        ]
+
+        def add_settings(cfg):
+            lines.extend(
+                [
+                    f"server = {cfg['server']}\n",
+                    f"domain = {cfg['domain']}\n",
+                    f"base_dn = {cfg['base_dn']}\n",
+                    f"use_ssl = {'true' if cfg['use_ssl'] else 'false'}\n",
+                    "max_retries = 5\n",
+                    "initial_retry_delay = 1.0\n",
+                    "max_retry_delay = 60.0\n",
+                    "health_check_interval = 30.0\n",
+                ]
+            )
+
+        for cfg in ad_configs:
+            lines.append(f"\n[ad_{cfg['domain']}]\n")
+            add_settings(cfg)
+
+        # Add legacy [ldap] section for backward compatibility
+        lines.append("\n# Legacy single AD support (for backward compatibility)\n")
+        lines.append("[ldap]\n")
+        add_settings(ad_configs[0])
+
+        # Write to a temporary file first so an interrupted wizard never
+        # leaves a half-written config behind
+        tmp_file = config_file.with_suffix(".ini.tmp")
+        tmp_file.write_text("".join(lines))
+        os.replace(tmp_file, config_file)
+
+        print(f"\n[OK] Configuration saved to: {config_file}")
+        if len(domains) > 1:
+            print(
+                f"[OK] Configured {len(domains)} Active Directory domains: {', '.join(domains)}"
+            )
+        print()
+        return True
+
+    except Exception as e:
+        print(f"\n[ERROR] Failed to save configuration: {e}")
+        return False
+
+
+def _run_update(check_only: bool = False, quiet: bool = False) -> bool:
+    """Run update check and optionally perform update.
+
+    Args:
+        check_only: If True, only check for updates without installing
+        quiet: If True, suppress output unless update is available
+
+    Returns:
+        True if update was performed successfully or no update needed
+    """
+    update_service = UpdateService()
+
+    if not quiet:
+        print("Checking for updates...")
+
+    result = update_service.check_for_update(force=True)
+
+    if result.error:
+        if not quiet:
+            print(f"Error checking for updates: {result.error}")
+        return False
+
+    if not result.update_available:
+        if not quiet:
+            print(f"ADTUI {result.current_version} is up to date.")
+        return True
+
+    print(f"Update available: {result.current_version} -> {result.latest_version}")
+
+    if check_only:
+        return True
+
+    print("Installing update...")
+    success, message = update_service.perform_update()
+
+    if success:
+        print(f"Update successful: {message}")
+        print("Please restart ADTUI to use the new version.")
+    else:
+        print(f"Update failed: {message}")
+
+    return success
+
+
+def _exit_with_error(message: str, code: int) -> NoReturn:
+    """Report a fatal startup error on stderr and exit immediately.
+
+    Skips interpreter teardown (atexit handlers, finalizers) since nothing
+    has been started yet that needs a clean shutdown.
+    """
+    sys.stdout.flush()
+    sys.stderr.write(message)
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def main():
+    """Main entry point for application."""
+
+    # Parse command-line arguments before starting Textual
+    parser = argparse.ArgumentParser(
+        description="ADTUI - Active Directory Terminal User Interface"
+    )
+    parser.add_argument(
+        "--version", "-V",
+        action="version",
+        version=f"adtui {__version__}"
+    )
+    parser.add_argument(
+        "--update", "-u",
+        action="store_true",
+        help="Check for updates and install if available, then exit"
+    )
+    parser.add_argument(
+        "--check-update",
+        action="store_true",
+        help="Check for updates without installing, then exit"
+    )
+    parser.add_argument(
+        "--no-auto-update",
+        action="store_true",
+        help="Skip automatic update check and installation at startup"
+    )
+    args = parser.parse_args()
+
+    # Handle update flags
+    if args.update:
+        _run_update(check_only=False)
+        return
+
+    if args.check_update:
+        _run_update(check_only=True)
+        return
+
+    # Auto-update before launching (default behavior)
+    if not args.no_auto_update:
+        try:
+            update_service = UpdateService()
+            # Only install what an earlier check found, however old: querying
+            # the repositories here would hold up startup, and the app checks
+            # again in the background once it is running
+            result = update_service.get_cached_result(fresh_only=False)
+
+            if result is not None and result.update_available:
+                print(f"Update available: {result.current_version} -> {result.latest_version}")
+                print("Installing update...")
+
+                success, message = update_service.perform_update()
+                if success:
+                    print(f"Update successful: {message}")
+                    print("Restarting ADTUI with new version...\n")
+
+                    # Restart the application with the new version
+                    # Use --no-auto-update to prevent infinite update loop
+                    os.execv(sys.executable, [sys.executable, "-m", "adtui", "--no-auto-update"])
+                else:
+                    print(f"Auto-update failed: {message}")
+                    print("Continuing with current version...\n")
+        except Exception:
+            # Silently continue if update check fails
+            pass
+
+    # Check if config exists, if not run wizard
+    def config_paths():
+        # Most likely location first; later ones are only built if it's missing
+        yield PlatformService.get_config_dir() / "config.ini"
+        # Add legacy Unix path only on non-Windows
+        legacy_path = PlatformService.get_legacy_config_path("config.ini")
+        if legacy_path:
+            yield legacy_path
+        yield Path.cwd() / "config.ini"
+
+    config_exists = any(p.exists() for p in config_paths())
+
+    if not config_exists:
+        print("No configuration file found.")
+        if not run_setup_wizard():
+            return
+
+    # Load configuration
+    try:
+        config_service = ConfigService()
+    except FileNotFoundError:
+        # Config still not found, offer to run wizard
+        response = (
+            input("Would you like to run the setup wizard? [Y/n]: ").strip().lower()
+        )
+        if response != "n":
+            if not run_setup_wizard():
+                return
+            # Try loading again
+            try:
+                config_service = ConfigService()
+            except Exception as e:
+                _exit_with_error(f"Failed to load configuration: {e}\n", 1)
+        else:
+            return
+    except Exception as e:
+        _exit_with_error(f"Error loading configuration: {e}\n", 1)
+
+    # Validate configuration
+    if not config_service.is_config_valid():
+        issues = config_service.get_config_issues()
+        _exit_with_error(
+            "Configuration errors:\n" + "".join(f"  - {i}\n" for i in issues), 2
+        )
+
+    # Textual and ldap3 are only loaded once the app is actually started
+    from .adtui import ADTUI
+
+    # Domain selection and login happen inside the app
+    try:
+        app = ADTUI(config_service=config_service)
+        app.run()
+    except Exception as e:
+        logger.error("Error running application: %s", e)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,148 @@
 import logging
 import os
 import sys
-from typing import TYPE_CHECKING, Callable, Dict, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from constants import MESSAGES, Severity
+from ui.dialogs import (
+    BaseConfirmDialog,
+    ConfirmDeleteDialog,
+    ConfirmDisableDialog,
+    ConfirmEnableDialog,
+    ConfirmMoveDialog,
+    ConfirmUndoDialog,
+    ConfirmUnlockDialog,
+    CopyUserDialog,
+    CreateOUDialog,
+    CreateUserDialog,
+)
 
 if TYPE_CHECKING:
     from textual.app import App
 
 logger = logging.getLogger(__name__)
 
+# Text shown by :help
+_HELP_TEXT = """[bold cyan]Available Commands:[/bold cyan]
+
+[bold]Search & Navigation:[/bold]
+/<query>         - Search (vim-style)
+:s <query>       - Search for objects
+:r, :refresh     - Refresh current OU
+
+[bold]Object Management:[/bold]
+:d, :del         - Delete selected object
+:m <path>        - Move to path with autocomplete
+:a, :attr        - View/edit attributes
+:g, :groups      - Manage group memberships
+:p, :passwd      - Set password
+
+[bold]User Management:[/bold]
+:ul, :unlock     - Unlock locked user account
+:en, :enable     - Enable disabled user account
+:dis, :disable   - Disable enabled user account
+:cu, :createuser - Create new user account
+:cp, :copyuser   - Copy user account
+
+[bold]OU Management:[/bold]
+:mkou, :createou - Create new OU
+:tree, :rebuild  - Rebuild AD tree
+
+[bold]Recovery & History:[/bold]
+:rb, :recycle    - Show AD Recycle Bin
+:rs, :restore    - Restore deleted object
+:u, :undo        - Undo last operation
+
+[bold]Other:[/bold]
+:h, :help        - Show this help
+:v, :version     - Show version
+:update          - Update to latest
+:logout, :lo     - Disconnect and return to login
+:q, :quit        - Quit application
+
+[bold]Keyboard Shortcuts:[/bold]
+r - Refresh    c - Create user    C - Copy user
+a - Attributes g - Groups         p - Password
+d - Delete     y - Copy DN        u - Undo
+U - Unlock     ? - Help           / - Search
+"""
+
+
+# Handler method names and the command names and aliases that run them
+_COMMAND_TABLE: List[Tuple[str, Tuple[str, ...]]] = [
+    # Search commands
+    ("_handle_search", ("/", "s")),
+    # Delete commands
+    ("_handle_delete", ("d", "del", "delete")),
+    # Move commands
+    ("_handle_move", ("m", "mv", "move")),
+    # OU commands
+    ("_handle_create_ou", ("mkou", "createou")),
+    # Recycle bin commands
+    ("_handle_recycle", ("recycle", "rb")),
+    ("_handle_restore", ("restore", "rs")),
+    # User management commands
+    ("_handle_unlock", ("unlock", "ul")),
+    ("_handle_enable", ("enable", "en")),
+    ("_handle_disable", ("disable", "dis")),
+    # Tree commands
+    ("_handle__tree", ("-tree", "tree", "rebuild")),
+    # User creation commands
+    ("_handle_create_user", ("createuser", "cu")),
+    ("_handle_copy_user", ("copyuser", "cp")),
+    # Undo commands
+    ("_handle_undo", ("undo", "u")),
+    # Refresh commands
+    ("_handle_refresh", ("refresh", "r")),
+    # Attributes commands
+    ("_handle_attributes", ("attributes", "attr", "a")),
+    # Groups commands
+    ("_handle_groups", ("groups", "g")),
+    # Password commands
+    ("_handle_password", ("password", "passwd", "p")),
+    # Help command
+    ("_handle_help", ("help", "h")),
+    # Quit command
+    ("_handle_quit", ("q", "quit", "exit")),
+    # Logout/disconnect command
+    ("_handle_logout", ("logout", "disconnect", "lo")),
+    # Version and update commands
+    ("_handle_version", ("version", "v")),
+    ("_handle_update", ("update",)),
+]
+
+
+def _build_command_map(
+    table: List[Tuple[str, Tuple[str, ...]]]
+) -> Dict[str, str]:
+    """Map every command name and alias in table to its handler name."""
+    commands: Dict[str, str] = {}
+    for handler, aliases in table:
+        for alias in aliases:
+            if alias in commands:
+                raise ValueError(
+                    f"Command alias {alias!r} is used by both "
+                    f"{commands[alias]} and {handler}"
+                )
+            commands[alias] = handler
+    return commands
+
 
 class CommandHandler:
     """Handles command parsing and execution."""
 
+    # Command names and aliases mapped to the names of their handler methods
+    COMMANDS: Dict[str, str] = _build_command_map(_COMMAND_TABLE)
+
+    # Undoable operation types mapped to the names of their undo methods
+    UNDO_HANDLERS: Dict[str, str] = {
+        "create_ou": "_undo_create_ou",
+        "move": "_undo_move",
+        "create_user": "_undo_create_user",
+        "copy_user": "_undo_copy_user",
+    }
+
     def __init__(self, app: "App"):
         """Initialize command handler.
 
@@ -24,79 +152,6 @@ class CommandHandler:
             app: The main application instance
         """
         self.app = app
-        self.commands = self._build_command_registry()
-
-    def _build_command_registry(self) -> Dict[str, Callable]:
-        """Build the command registry mapping command names to handlers."""
-        return {
-            # Search commands
-            "/": self._handle_search,
-            "s": self._handle_search,
-            # Delete commands
-            "d": self._handle_delete,
-            "del": self._handle_delete,
-            "delete": self._handle_delete,
-            # Move commands
-            "m": self._handle_move,
-            "mv": self._handle_move,
-            "move": self._handle_move,
-            # OU commands
-            "mkou": self._handle_create_ou,
-            "createou": self._handle_create_ou,
-            # Recycle bin commands
-            "recycle": self._handle_recycle,
-            "rb": self._handle_recycle,
-            "restore": self._handle_restore,
-            "rs": self._handle_restore,
-            # User management commands
-            "unlock": self._handle_unlock,
-            "ul": self._handle_unlock,
-            "enable": self._handle_enable,
-            "en": self._handle_enable,
-            "disable": self._handle_disable,
-            "dis": self._handle_disable,
-            # Tree commands
-            "-tree": self._handle__tree,
-            "tree": self._handle__tree,
-            "rebuild": self._handle__tree,
-            # User creation commands
-            "createuser": self._handle_create_user,
-            "cu": self._handle_create_user,
-            "copyuser": self._handle_copy_user,
-            "cp": self._handle_copy_user,
-            # Undo commands
-            "undo": self._handle_undo,
-            "u": self._handle_undo,
-            # Refresh commands
-            "refresh": self._handle_refresh,
-            "r": self._handle_refresh,
-            # Attributes commands
-            "attributes": self._handle_attributes,
-            "attr": self._handle_attributes,
-            "a": self._handle_attributes,
-            # Groups commands
-            "groups": self._handle_groups,
-            "g": self._handle_groups,
-            # Password commands
-            "password": self._handle_password,
-            "passwd": self._handle_password,
-            "p": self._handle_password,
-            # Help command
-            "help": self._handle_help,
-            "h": self._handle_help,
-            # Quit command
-            "q": self._handle_quit,
-            "quit": self._handle_quit,
-            "exit": self._handle_quit,
-            # Logout/disconnect command
-            "logout": self._handle_logout,
-            "disconnect": self._handle_logout,
-            "lo": self._handle_logout,
-            # Version and update commands
-            "version": self._handle_version,
-            "v": self._handle_version,
-            "update": self._handle_update,
-        }
 
     def execute(self, command_str: str) -> None:
         """Parse and execute a command.
@@ -107,8 +162,10 @@ class CommandHandler:
         if not command_str:
             return
 
+        prefix = command_str[0]
+
         # Handle search with /
-        if command_str.startswith("/"):
+        if prefix == "/":
             query = command_str[1:].strip()
             if query:
                 self._handle_search(query)
@@ -119,11 +176,11 @@ class CommandHandler:
             return
 
         # Remove colon prefix if present
-        if command_str.startswith(":"):
+        if prefix == ":":
             command_str = command_str[1:]
 
         # Split into command and arguments (preserve spaces in args)
-        parts = command_str.split(maxsplit=1)
+        parts = command_str.split(None, 1)
         if not parts:
             return
 
@@ -131,16 +188,18 @@ class CommandHandler:
         args = parts[1] if len(parts) > 1 else ""
 
         # Look up and execute command
-        handler = self.commands.get(command)
-        if handler:
-            handler(args)
-        else:
+        try:
+            name = self.COMMANDS[command]
+        except KeyError:
             self.app.notify(
                 f"Unknown command: {command}", severity=Severity.WARNING.value
             )
+            return
+        getattr(self, name)(args)
 
     def _handle_search(self, query: str) -> None:
         """Handle search command."""
+        query = query.strip()
         if not query:
             self.app.notify(MESSAGES["SEARCH_EMPTY"], severity=Severity.WARNING.value)
             return
@@ -162,8 +221,6 @@ class CommandHandler:
 
         self.app.pending_delete_dn = self.app.current_selected_dn
 
-        from ui.dialogs import ConfirmDeleteDialog
-
         self.app.push_screen(
             ConfirmDeleteDialog(
                 self.app.current_selected_label, self.app.current_selected_dn
@@ -196,8 +253,6 @@ class CommandHandler:
         self.app.pending_move_dn = self.app.current_selected_dn
         self.app.pending_move_target = target_dn
 
-        from ui.dialogs import ConfirmMoveDialog
-
         self.app.push_screen(
             ConfirmMoveDialog(
                 self.app.current_selected_label, self.app.current_selected_dn, target_dn
@@ -216,8 +271,6 @@ class CommandHandler:
                 )
                 return
 
-            from ui.dialogs import CreateOUDialog
-
             self.app.push_screen(
                 CreateOUDialog(parent_dn=self.app.current_selected_dn),
                 self.app.handle_create_ou_confirmation,
@@ -235,36 +288,38 @@ class CommandHandler:
             self.app.create_ou_in_parent(ou_name, self.app.current_selected_dn)
 
     def _handle_recycle(self, args: str) -> None:
-        """Handle recycle bin view command. Optional search query filters results."""
-        try:
-            query = args.strip()
-            if query:
-                # Search deleted objects matching the query
-                results = self.app.ldap_service.search_deleted_objects(query)
-                self.app.search_results_pane.populate(
-                    results, self.app.connection_manager
-                )
-                self.app.search_results_pane.styles.display = "block"
-                self.app.search_results_pane.focus()
-                self.app.notify(
-                    f"Found {len(results)} deleted objects matching '{query}'. Use :restore <name> to restore.",
-                    severity=Severity.INFORMATION.value,
-                )
-            else:
-                # Show all deleted objects
-                results = self.app.ldap_service.get_deleted_objects()
-                self.app.search_results_pane.populate(
-                    results, self.app.connection_manager
-                )
-                self.app.search_results_pane.styles.display = "block"
-                self.app.search_results_pane.focus()
-                self.app.notify(
-                    f"Found {len(results)} deleted objects. Use :restore <name> to restore.",
-                    severity=Severity.INFORMATION.value,
-                )
-        except Exception as e:
+        """Handle recycle bin view command. Optional search query filters results.
+
+        The lookup runs in a worker thread so a large Recycle Bin does not
+        freeze the UI; the results pane is filled once it returns.
+        """
+        query = args.strip()
+        ldap_service = self.app.ldap_service
+        if query:
+            # Search deleted objects matching the query
+            lookup, lookup_args = ldap_service.search_deleted_objects, (query,)
+            matching = f" matching '{query}'"
+        else:
+            # Show all deleted objects
+            lookup, lookup_args = ldap_service.get_deleted_objects, ()
+            matching = ""
+
+        def show(results) -> None:
+            self.app.search_results_pane.populate(
+                results, self.app.connection_manager
+            )
+            self.app.search_results_pane.styles.display = "block"
+            self.app.search_results_pane.focus()
+            self.app.notify(
+                f"Found {len(results)} deleted objects{matching}. Use :restore <name> to restore.",
+                severity=Severity.INFORMATION.value,
+            )
+
+        def failed(e: Exception) -> None:
             self.app.notify(str(e), severity=Severity.ERROR.value)
 
+        self.app._run_ldap(lookup, *lookup_args, on_done=show, on_error=failed)
+
     def _handle_restore(self, cn: str) -> None:
         """Handle restore command."""
         if not cn:
@@ -292,26 +347,15 @@ class CommandHandler:
             )
 
     def _is_user_object(self, dn: str) -> bool:
-        """Check if DN represents a user object."""
-        try:
-            self.app.ldap_service.conn.search(
-                dn, "(objectClass=*)", search_scope="BASE", attributes=["objectClass"]
-            )
-            if self.app.ldap_service.conn.entries:
-                obj_classes = [
-                    str(cls).lower()
-                    for cls in self.app.ldap_service.conn.entries[0].objectClass
-                ]
-                return "user" in obj_classes and "computer" not in obj_classes
-            return False
-        except Exception as e:
-            logger.debug("Error checking if object is user: %s", e)
-            return False
+        """Check if DN represents a user object.
+
+        Shares the app's per-DN cache, so repeated commands on the same
+        selection do not each search the directory.
+        """
+        return self.app._is_user_object(dn)
 
     def _handle_create_user(self, args: str) -> None:
         """Handle create user command."""
-        from ui.dialogs import CreateUserDialog
-
         # Determine target OU
         if args.strip():
             # Use specified OU path
@@ -333,8 +377,6 @@ class CommandHandler:
 
     def _handle_copy_user(self, args: str) -> None:
         """Handle copy user command."""
-        from ui.dialogs import CopyUserDialog
-
         # Parse arguments: [source_dn] [target_ou]
         parts = args.strip().split(maxsplit=1)
 
@@ -357,16 +399,12 @@ class CommandHandler:
         elif len(parts) == 1:
             # Source DN specified, use current OU as target
             source_dn = parts[0]
-            source_label = (
-                source_dn.split(",")[0].split("=")[1] if "=" in source_dn else source_dn
-            )
+            source_label = self.app.path_service.extract_cn(source_dn)
             target_ou = self._get_current_ou()
         else:
             # Both source and target specified
             source_dn = parts[0]
-            source_label = (
-                source_dn.split(",")[0].split("=")[1] if "=" in source_dn else source_dn
-            )
+            source_label = self.app.path_service.extract_cn(source_dn)
             target_ou = self.app.path_service.resolve_path(parts[1])
 
         if not target_ou:
@@ -380,22 +418,7 @@ class CommandHandler:
 
     def _get_current_ou(self) -> str:
         """Get the currently selected OU DN."""
-        if self.app.current_selected_dn:
-            # Check if current selection is an OU
-            if self.app.current_selected_label and "📁" in str(
-                self.app.current_selected_label
-            ):
-                return self.app.current_selected_dn
-            else:
-                # Get parent OU of selected object
-                dn_parts = self.app.current_selected_dn.split(",")
-                if len(dn_parts) > 1:
-                    return ",".join(dn_parts[1:])
-
-        # Fallback to base DN
-        return (
-            self.app.ldap_service.base_dn if self.app.ldap_service else self.app.base_dn
-        )
+        return self.app._get_current_ou()
 
     def _handle_unlock(self, args: str) -> None:
         """Handle unlock command."""
@@ -411,8 +434,6 @@ class CommandHandler:
             )
             return
 
-        from ui.dialogs import ConfirmUnlockDialog
-
         self.app.push_screen(
             ConfirmUnlockDialog(
                 self.app.current_selected_label, self.app.current_selected_dn
@@ -434,8 +455,6 @@ class CommandHandler:
             )
             return
 
-        from ui.dialogs import ConfirmEnableDialog
-
         self.app.push_screen(
             ConfirmEnableDialog(
                 self.app.current_selected_label, self.app.current_selected_dn
@@ -446,19 +465,27 @@ class CommandHandler:
     def _handle__tree(self, args: str) -> None:
         """Handle  tree command - rebuild tree."""
         try:
-            self.app.notify("Rebuilding AD tree...", severity="information")
+            self.app.notify(
+                "Rebuilding AD tree...", severity=Severity.INFORMATION.value
+            )
 
             if (
                 hasattr(self.app, "adtree")
                 and self.app.adtree
                 and self.app.adtree.connection_manager
             ):
+                # Objects may have changed class or moved since the last build
+                self.app.forget_user_checks()
                 self.app.adtree.build_tree()
-                self.app.notify("Tree rebuilt successfully", severity="information")
+                self.app.notify(
+                    "Tree rebuilt successfully", severity=Severity.INFORMATION.value
+                )
             else:
-                self.app.notify("ADTree not available", severity="error")
+                self.app.notify("ADTree not available", severity=Severity.ERROR.value)
         except Exception as e:
-            self.app.notify(f"Error rebuilding tree: {e}", severity="error")
+            self.app.notify(
+                f"Error rebuilding tree: {e}", severity=Severity.ERROR.value
+            )
             import traceback
 
             traceback.print_exc()
@@ -477,8 +504,6 @@ class CommandHandler:
             )
             return
 
-        from ui.dialogs import ConfirmDisableDialog
-
         self.app.push_screen(
             ConfirmDisableDialog(
                 self.app.current_selected_label, self.app.current_selected_dn
@@ -500,56 +525,59 @@ class CommandHandler:
             self.app.notify(
                 MESSAGES["UNDO_DELETE_WARNING"], severity=Severity.WARNING.value
             )
-        elif last_op.type == "create_ou":
-            from ui.dialogs import ConfirmUndoDialog
-
-            self.app.push_screen(
-                ConfirmUndoDialog(f"Delete OU: {last_op.details['name']}"),
-                lambda confirmed: self.app.undo_create_ou(last_op)
-                if confirmed
-                else None,
-            )
-        elif last_op.type == "move":
-            from ui.dialogs import ConfirmUndoDialog
-
-            self.app.push_screen(
-                ConfirmUndoDialog(f"Move back: {last_op.details['object']}"),
-                lambda confirmed: self.app.undo_move(last_op) if confirmed else None,
-            )
-        elif last_op.type == "create_user":
-            from ui.dialogs import BaseConfirmDialog
-
-            self.app.push_screen(
-                BaseConfirmDialog(
-                    title="[bold red]⚠ Undo Create User[/bold red]",
-                    message=f"Are you sure you want to undo creating this user?\n\n{last_op.details['full_name']} ({last_op.details['samaccount']})\n\n[yellow]This will permanently delete of user account.[/yellow]",
-                    confirm_text="Delete",
-                    confirm_variant="error",
-                ),
-                lambda confirmed: self.app.undo_create_user(last_op)
-                if confirmed
-                else None,
-            )
-        elif last_op.type == "copy_user":
-            from ui.dialogs import BaseConfirmDialog
+            return
 
-            self.app.push_screen(
-                BaseConfirmDialog(
-                    title="[bold red]⚠ Undo Copy User[/bold red]",
-                    message=f"Are you sure you want to undo copying this user?\n\n{last_op.details['full_name']} ({last_op.details['samaccount']})\n\n[yellow]This will permanently delete of copied user account.[/yellow]",
-                    confirm_text="Delete",
-                    confirm_variant="error",
-                ),
-                lambda confirmed: self.app.undo_copy_user(last_op)
-                if confirmed
-                else None,
-            )
+        name = self.UNDO_HANDLERS.get(last_op.type)
+        if name:
+            getattr(self, name)(last_op)
         else:
             self.app.notify(
                 f"Cannot undo operation type: {last_op.type}",
                 severity=Severity.WARNING.value,
             )
 
+    def _undo_create_ou(self, last_op) -> None:
+        """Confirm and undo an OU creation."""
+        self.app.push_screen(
+            ConfirmUndoDialog(f"Delete OU: {last_op.details['name']}"),
+            lambda confirmed: self.app.undo_create_ou(last_op) if confirmed else None,
+        )
+
+    def _undo_move(self, last_op) -> None:
+        """Confirm and undo a move."""
+        self.app.push_screen(
+            ConfirmUndoDialog(f"Move back: {last_op.details['object']}"),
+            lambda confirmed: self.app.undo_move(last_op) if confirmed else None,
+        )
+
+    def _undo_create_user(self, last_op) -> None:
+        """Confirm and undo a user creation."""
+        self.app.push_screen(
+            BaseConfirmDialog(
+                title="[bold red]⚠ Undo Create User[/bold red]",
+                message=f"Are you sure you want to undo creating this user?\n\n{last_op.details['full_name']} ({last_op.details['samaccount']})\n\n[yellow]This will permanently delete of user account.[/yellow]",
+                confirm_text="Delete",
+                confirm_variant="error",
+            ),
+            lambda confirmed: self.app.undo_create_user(last_op)
+            if confirmed
+            else None,
+        )
+
+    def _undo_copy_user(self, last_op) -> None:
+        """Confirm and undo a user copy."""
+        self.app.push_screen(
+            BaseConfirmDialog(
+                title="[bold red]⚠ Undo Copy User[/bold red]",
+                message=f"Are you sure you want to undo copying this user?\n\n{last_op.details['full_name']} ({last_op.details['samaccount']})\n\n[yellow]This will permanently delete of copied user account.[/yellow]",
+                confirm_text="Delete",
+                confirm_variant="error",
+            ),
+            lambda confirmed: self.app.undo_copy_user(last_op)
+            if confirmed
+            else None,
+        )
+
     def _handle_refresh(self, args: str) -> None:
         """Handle refresh command."""
         self.app.action_refresh_ou()
@@ -626,8 +654,6 @@ class CommandHandler:
                 return
 
             # Show update confirmation dialog
-            from ui.dialogs import BaseConfirmDialog
-
             self.app.push_screen(
                 BaseConfirmDialog(
                     title="[bold cyan]Update Available[/bold cyan]",
@@ -652,7 +678,9 @@ class CommandHandler:
             return
 
         # Perform update in background
-        self.app.notify("Updating ADTUI... Please wait.", severity=Severity.INFORMATION.value)
+        self.app.notify(
+            "Updating ADTUI... Please wait.", severity=Severity.INFORMATION.value
+        )
 
         def do_update():
             try:
@@ -689,50 +717,7 @@ class CommandHandler:
 
     def _handle_help(self, args: str) -> None:
         """Handle help command."""
-        help_text = """[bold cyan]Available Commands:[/bold cyan]
-
-[bold]Search & Navigation:[/bold]
-/<query>         - Search (vim-style)
-:s <query>       - Search for objects
-:r, :refresh     - Refresh current OU
-
-[bold]Object Management:[/bold]
-:d, :del         - Delete selected object
-:m <path>        - Move to path with autocomplete
-:a, :attr        - View/edit attributes
-:g, :groups      - Manage group memberships
-:p, :passwd      - Set password
-
-[bold]User Management:[/bold]
-:ul, :unlock     - Unlock locked user account
-:en, :enable     - Enable disabled user account
-:dis, :disable   - Disable enabled user account
-:cu, :createuser - Create new user account
-:cp, :copyuser   - Copy user account
-
-[bold]OU Management:[/bold]
-:mkou, :createou - Create new OU
-:tree, :rebuild  - Rebuild AD tree
-
-[bold]Recovery & History:[/bold]
-:rb, :recycle    - Show AD Recycle Bin
-:rs, :restore    - Restore deleted object
-:u, :undo        - Undo last operation
-
-[bold]Other:[/bold]
-:h, :help        - Show this help
-:v, :version     - Show version
-:update          - Update to latest
-:logout, :lo     - Disconnect and return to login
-:q, :quit        - Quit application
-
-[bold]Keyboard Shortcuts:[/bold]
-r - Refresh    c - Create user    C - Copy user
-a - Attributes g - Groups         p - Password
-d - Delete     y - Copy DN        u - Undo
-U - Unlock     ? - Help           / - Search
-"""
-        self.app.notify(help_text, timeout=15)
+        self.app.notify(_HELP_TEXT, timeout=15)
 
     def _handle_quit(self, args: str) -> None:
         """Handle quit command."""
@@ -743,4 +728,6 @@ U - Unlock     ? - Help           / - Search
         if hasattr(self.app, 'action_logout'):
             self.app.action_logout()
         else:
-            self.app.notify("Logout not available in this mode", severity="warning")
+            self.app.notify(
+                "Logout not available in this mode", severity=Severity.WARNING.value
+            )
@@ -65,7 +65,7 @@ class AccountPolicy:
 
     WARNING_DAYS_CRITICAL = 7
     WARNING_DAYS_NORMAL = 30
-    NEVER_EXPIRES_VALUES = [0, 9223372036854775807]  # 0x7FFFFFFFFFFFFFFF
+    NEVER_EXPIRES_VALUES = frozenset({0, 0x7FFFFFFFFFFFFFFF})
 
 
 class HistorySettings:
@@ -1,20 +1,30 @@
-"""Services module for ADTUI."""
+"""Services module for ADTUI.
 
-from .ldap_service import LDAPService
-from .history_service import HistoryService, Operation
-from .path_service import PathService
-from .connection_manager import ConnectionManager, ConnectionState
-from .update_service import UpdateService, UpdateCheckResult
-from .platform_service import PlatformService
+The services are imported on first access so that light modules (config,
+platform, updates) can be used without loading ldap3.
+"""
 
-__all__ = [
-    'LDAPService',
-    'HistoryService',
-    'Operation',
-    'PathService',
-    'ConnectionManager',
-    'ConnectionState',
-    'UpdateService',
-    'UpdateCheckResult',
-    'PlatformService',
-]
+from importlib import import_module
+
+_EXPORTS = {
+    'LDAPService': 'ldap_service',
+    'HistoryService': 'history_service',
+    'Operation': 'history_service',
+    'PathService': 'path_service',
+    'ConnectionManager': 'connection_manager',
+    'ConnectionState': 'connection_manager',
+    'UpdateService': 'update_service',
+    'UpdateCheckResult': 'update_service',
+    'PlatformService': 'platform_service',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -2,13 +2,26 @@
 
 import configparser
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 class ADConfig:
     """Represents a single AD configuration."""
 
+    __slots__ = (
+        "domain",
+        "server",
+        "base_dn",
+        "use_ssl",
+        "max_retries",
+        "initial_retry_delay",
+        "max_retry_delay",
+        "health_check_interval",
+        "pool_size",
+    )
+
     def __init__(
         self,
         domain: str,
@@ -19,6 +32,7 @@ class ADConfig:
         initial_retry_delay: float = 1.0,
         max_retry_delay: float = 60.0,
         health_check_interval: float = 30.0,
+        pool_size: int = 4,
     ):
         self.domain = domain
         self.server = server
@@ -28,6 +42,7 @@ class ADConfig:
         self.initial_retry_delay = initial_retry_delay
         self.max_retry_delay = max_retry_delay
         self.health_check_interval = health_check_interval
+        self.pool_size = pool_size
 
     def __str__(self) -> str:
         return f"{self.domain} ({self.server})"
@@ -38,10 +53,9 @@ def get_config_search_paths(config_file: str = "config.ini") -> List[str]:
     from .platform_service import PlatformService
 
     # Environment variable override
-    if os.getenv("ADTUI_CONFIG"):
-        env_config = os.getenv("ADTUI_CONFIG")
-        if env_config and os.path.exists(env_config):
-            return [env_config]
+    env_config = os.getenv("ADTUI_CONFIG")
+    if env_config and os.path.exists(env_config):
+        return [env_config]
 
     # User-specific config directory (preferred)
     user_config_dir = PlatformService.get_config_dir()
@@ -66,39 +80,48 @@ def get_config_search_paths(config_file: str = "config.ini") -> List[str]:
     ]
 
 
+@lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int) -> configparser.ConfigParser:
+    """Parse a config file, reusing the result while the file is unchanged.
+
+    Args:
+        path: Path of the config file
+        mtime_ns: Modification time of the file; part of the cache key so an
+            edited file is parsed again
+
+    Returns:
+        Parsed config; callers must not modify it
+    """
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
 class ConfigService:
     """Service for loading and managing AD configurations."""
 
     def __init__(self, config_file: str = "config.ini"):
-        # Search for existing config file
-        search_paths = get_config_search_paths(config_file)
-
-        # Find first existing config
-        self.config_file = None
-        for path in search_paths:
-            if os.path.exists(path):
-                self.config_file = path
-                break
-
-        # No existing config found, use preferred default location
-        if self.config_file is None:
-            self.config_file = search_paths[0]
+        # The first search path is the existing config if one was found,
+        # otherwise the preferred default location
+        self.config_file = get_config_search_paths(config_file)[0]
 
-        self.config = configparser.ConfigParser()
         self.ad_configs: Dict[str, ADConfig] = {}
         self._load_config()
 
     def _load_config(self) -> None:
         """Load configuration from file."""
-        if not os.path.exists(self.config_file):
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
             # Provide helpful error message with creation guidance
             config_dir = os.path.dirname(self.config_file)
             config_name = os.path.basename(self.config_file)
 
             # Suggest creation command
-            if config_dir.startswith(str(Path.home())):
+            home = str(Path.home())
+            if config_dir.startswith(home):
                 # Home directory config
-                relative_config = self.config_file.replace(str(Path.home()), "~")
+                relative_config = self.config_file.replace(home, "~")
                 print(f"Configuration file not found at: {relative_config}")
                 print(f"Creating config directory: {config_dir}")
                 os.makedirs(config_dir, exist_ok=True)
@@ -116,9 +139,9 @@ class ConfigService:
 
             raise FileNotFoundError(
                 f"Configuration file '{self.config_file}' not found"
-            )
+            ) from None
 
-        self.config.read(self.config_file)
+        self.config = _read_config(self.config_file, mtime_ns)
 
         # Try to load multi-AD configuration first
         if self._has_multi_ad_config():
@@ -134,7 +157,7 @@ class ConfigService:
     def _load_multi_ad_config(self) -> None:
         """Load multi-AD configuration."""
         domains_str = self.config["ad_domains"]["domains"]
-        domains = [d.strip() for d in domains_str.split(",") if d.strip()]
+        domains = [d for d in (d.strip() for d in domains_str.split(",")) if d]
 
         for domain in domains:
             section_name = f"ad_{domain}"
@@ -155,6 +178,7 @@ class ConfigService:
                     health_check_interval=ad_config.getfloat(
                         "health_check_interval", fallback=30.0
                     ),
+                    pool_size=ad_config.getint("pool_size", fallback=4),
                 )
 
     def _load_legacy_config(self) -> None:
@@ -175,6 +199,7 @@ class ConfigService:
                 health_check_interval=ldap_config.getfloat(
                     "health_check_interval", fallback=30.0
                 ),
+                pool_size=ldap_config.getint("pool_size", fallback=4),
             )
 
     def get_available_domains(self) -> List[str]:
@@ -194,21 +219,26 @@ class ConfigService:
         domains = self.get_available_domains()
         return domains[0] if domains else None
 
-    def validate_config(self) -> Tuple[bool, List[str]]:
-        """Validate configuration and return any issues."""
-        issues = []
-
+    def get_config_issues(self) -> Iterator[str]:
+        """Yield a description of each configuration problem found."""
         if not self.ad_configs:
-            issues.append("No AD configurations found")
-            return False, issues
+            yield "No AD configurations found"
+            return
 
         # Check each configuration
         for domain, config in self.ad_configs.items():
             if not config.server:
-                issues.append(f"Domain {domain}: Missing server")
+                yield f"Domain {domain}: Missing server"
             if not config.base_dn:
-                issues.append(f"Domain {domain}: Missing base_dn")
+                yield f"Domain {domain}: Missing base_dn"
 
+    def is_config_valid(self) -> bool:
+        """Check the configuration, stopping at the first problem."""
+        return next(self.get_config_issues(), None) is None
+
+    def validate_config(self) -> Tuple[bool, List[str]]:
+        """Validate configuration and return any issues."""
+        issues = list(self.get_config_issues())
         return len(issues) == 0, issues
 
     def get_config_file_path(self) -> str:
@@ -3,9 +3,12 @@
 import time
 import threading
 import logging
-from typing import Optional, Callable
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Optional, Callable
 from enum import Enum
 from ldap3 import Connection, Server, ALL
+from ldap3.core.exceptions import LDAPBindError
 
 try:
     from .config_service import ADConfig
@@ -17,6 +20,16 @@ logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _get_server(host: str, port: int, use_ssl: bool) -> Server:
+    """Get the shared Server object for a domain controller.
+
+    The server keeps the DSE and schema read by the first connection, so
+    later connections and logins can skip reading them again.
+    """
+    return Server(host, port=port, use_ssl=use_ssl, get_info=ALL)
+
+
 class ConnectionState(Enum):
     """Connection state enumeration."""
 
@@ -39,6 +52,7 @@ class ConnectionManager:
         initial_retry_delay: float = 1.0,
         max_retry_delay: float = 60.0,
         health_check_interval: float = 30.0,
+        pool_size: int = 4,
     ):
         """Initialize connection manager.
 
@@ -50,6 +64,7 @@ class ConnectionManager:
             initial_retry_delay: Initial delay between retries (seconds)
             max_retry_delay: Maximum delay between retries (seconds)
             health_check_interval: Interval for health checks (seconds)
+            pool_size: Maximum number of concurrent LDAP connections
         """
         self.ad_config = ad_config
         self.username = username
@@ -58,6 +73,7 @@ class ConnectionManager:
         self.initial_retry_delay = initial_retry_delay
         self.max_retry_delay = max_retry_delay
         self.health_check_interval = health_check_interval
+        self.pool_size = max(1, pool_size)
 
         # Connection state
         self._connection: Optional[Connection] = None
@@ -65,6 +81,13 @@ class ConnectionManager:
         self._state_lock = threading.Lock()
         self._connection_lock = threading.Lock()
 
+        # Connection pool: idle connections and a generation counter so
+        # connections from before a reconnect are dropped. The primary
+        # connection is never pooled; the health check uses it.
+        self._idle: List[Connection] = []
+        self._pool_generation = 0
+        self._pool_semaphore = threading.BoundedSemaphore(self.pool_size)
+
         # Retry state
         self._retry_count = 0
         self._last_error: Optional[str] = None
@@ -171,18 +194,21 @@ class ConnectionManager:
         """
         bind_dn = f"{self.username}@{self.ad_config.domain}"
         port = 636 if self.ad_config.use_ssl else 389
-        server = Server(
-            self.ad_config.server,
-            port=port,
-            use_ssl=self.ad_config.use_ssl,
-            get_info=ALL,
-        )
+        server = _get_server(self.ad_config.server, port, self.ad_config.use_ssl)
 
         logger.info(
             f"Creating connection to {self.ad_config.server}:{port} as {bind_dn}"
         )
 
-        conn = Connection(server, user=bind_dn, password=self.password, auto_bind=True)
+        conn = Connection(server, user=bind_dn, password=self.password)
+        # Only the first bind to a server reads its DSE and schema
+        conn.bind(read_server_info=server.info is None or server.schema is None)
+        if not conn.bound:
+            error = "automatic bind not successful" + (
+                f" - {conn.last_error}" if conn.last_error else ""
+            )
+            conn.unbind()
+            raise LDAPBindError(error)
 
         if not self.ad_config.use_ssl:
             logger.warning(
@@ -235,6 +261,7 @@ class ConnectionManager:
         try:
             with self._connection_lock:
                 self._connection = self._create_connection()
+                self._reset_pool()
 
             self._set_state(ConnectionState.CONNECTED)
             self._retry_count = 0
@@ -297,10 +324,12 @@ class ConnectionManager:
                     except Exception:
                         pass  # Ignore unbind errors during cleanup
                     self._connection = None
+                self._reset_pool()
 
             # Attempt new connection
             with self._connection_lock:
                 self._connection = self._create_connection()
+                self._reset_pool()
 
             self._set_state(ConnectionState.CONNECTED)
             self._retry_count = 0
@@ -383,6 +412,72 @@ class ConnectionManager:
         self._health_check_timer.daemon = True
         self._health_check_timer.start()
 
+    def _reset_pool(self):
+        """Drop pooled connections.
+
+        Must be called with the connection lock held.
+        """
+        for conn in self._idle:
+            self._discard(conn)
+        self._idle = []
+        self._pool_generation += 1
+
+    @staticmethod
+    def _discard(conn: Connection):
+        """Unbind a pooled connection that will not be used again."""
+        try:
+            conn.unbind()
+        except Exception:
+            pass  # Ignore unbind errors during cleanup
+
+    @contextmanager
+    def acquire(self) -> Iterator[Connection]:
+        """Borrow a pooled connection for the duration of an operation.
+
+        Up to pool_size operations can run concurrently; connections are
+        bound lazily the first time they are needed. A connection found
+        closed, or one an operation raised on, is unbound instead of being
+        pooled again, so retries get a different connection.
+
+        Yields:
+            LDAP connection reserved for the caller
+
+        Raises:
+            Exception: If no connection is available
+        """
+        if not self.get_connection():
+            raise Exception("No connection available")
+
+        with self._pool_semaphore:
+            conn = None
+            stale: List[Connection] = []
+            with self._connection_lock:
+                generation = self._pool_generation
+                while self._idle and conn is None:
+                    conn = self._idle.pop()
+                    # The server may have dropped it while it sat idle
+                    if conn.closed or not conn.bound:
+                        stale.append(conn)
+                        conn = None
+            for dead in stale:
+                self._discard(dead)
+
+            if conn is None:
+                conn = self._create_connection()
+
+            try:
+                yield conn
+            except BaseException:
+                self._discard(conn)
+                raise
+
+            with self._connection_lock:
+                if generation == self._pool_generation:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                self._discard(conn)
+
     def get_connection(self) -> Optional[Connection]:
         """Get a valid connection, reconnecting if necessary.
 
@@ -434,12 +529,12 @@ class ConnectionManager:
         operation_retry_count = 0
 
         while operation_retry_count < max_operation_retries:
-            conn = self.get_connection()
-            if not conn:
+            if not self.get_connection():
                 raise Exception("No connection available")
 
             try:
-                return operation(conn, *args, **kwargs)
+                with self.acquire() as conn:
+                    return operation(conn, *args, **kwargs)
 
             except Exception as e:
                 operation_retry_count += 1
@@ -459,6 +554,36 @@ class ConnectionManager:
                 # Wait a bit before retry
                 time.sleep(0.5)
 
+    def search_raw(
+        self, search_base: str, search_filter: str, attributes: List[str], **kwargs
+    ) -> List[dict]:
+        """Run a search and return the raw response entries.
+
+        Reads conn.response directly instead of conn.entries, which skips
+        building an ldap3 Entry object for every result.
+
+        Args:
+            search_base: Base DN to search from
+            search_filter: LDAP filter
+            attributes: Attributes to return
+            **kwargs: Additional arguments for Connection.search
+
+        Returns:
+            List of response dicts with "dn" and "attributes" keys
+        """
+
+        def search_op(conn: Connection):
+            conn.search(
+                search_base,
+                search_filter,
+                attributes=attributes,
+                get_operational_attributes=False,
+                **kwargs,
+            )
+            return [r for r in conn.response if r.get("type") == "searchResEntry"]
+
+        return self.execute_with_retry(search_op)
+
     def close(self):
         """Close connection and cleanup resources."""
         logger.info("Closing connection manager")
@@ -476,5 +601,6 @@ class ConnectionManager:
                 except Exception:
                     pass  # Ignore unbind errors during cleanup
                 self._connection = None
+            self._reset_pool()
 
         self._set_state(ConnectionState.DISCONNECTED)
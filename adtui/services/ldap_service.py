@@ -4,23 +4,42 @@ import logging
 import os
 import sys
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
+from typing import AbstractSet, List, Dict, Optional, Tuple, Any
 
 from ldap3 import Connection, MODIFY_DELETE, MODIFY_REPLACE, MODIFY_ADD
+from ldap3.utils.conv import escape_filter_chars
 
 # Add parent directory to path to import constants
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from constants import (
-    ObjectIcon,
-    ObjectType,
-    SearchScope,
-    LDAPControl,
-    UserAccountControl,
-)
+from constants import ObjectIcon, LDAPControl
 from .connection_manager import ConnectionManager
+from .path_service import split_dn
 
 logger = logging.getLogger(__name__)
 
+# Icons by objectClass, checked in order: computers are users too, so the
+# computer class has to win
+_CLASS_ICONS = (
+    ("computer", ObjectIcon.COMPUTER.value),
+    ("user", ObjectIcon.USER.value),
+    ("group", ObjectIcon.GROUP.value),
+    ("organizationalunit", ObjectIcon.OU.value),
+)
+
+
+def _first_value(value: Any) -> Optional[str]:
+    """Get a single string from a raw response attribute value.
+
+    Args:
+        value: Attribute value (scalar, list, or None)
+
+    Returns:
+        First value as a string, or None if empty
+    """
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return str(value) if value else None
+
 
 class LDAPService:
     """Handles all LDAP/Active Directory operations."""
@@ -56,8 +75,13 @@ class LDAPService:
             object_types: List of object types to search for (user, computer, group)
 
         Returns:
-            List of dictionaries containing label and dn
+            List of dictionaries containing label and dn; empty for a blank
+            query, which would otherwise match every object
         """
+        query = query.strip()
+        if not query:
+            return []
+
         if object_types is None:
             object_types = ["user", "computer", "group"]
 
@@ -69,38 +93,39 @@ class LDAPService:
                 "(|" + "".join([f"(objectClass={obj})" for obj in object_types]) + ")"
             )
 
+        # Escape the query so "*", "(" and ")" in it match literally
+        query = escape_filter_chars(query)
         ldap_filter = f"(&(|(cn=*{query}*)(sAMAccountName=*{query}*)){obj_filter})"
 
         try:
+            response = self.connection_manager.search_raw(
+                self.base_dn,
+                ldap_filter,
+                ["cn", "objectClass", "sAMAccountName"],
+                size_limit=1000,
+            )
 
-            def search_op(conn: Connection):
-                conn.search(
-                    self.base_dn,
-                    ldap_filter,
-                    attributes=["cn", "objectClass", "sAMAccountName"],
-                    size_limit=1000,
+            results = []
+            for entry in response:
+                attrs = entry["attributes"]
+                cn = _first_value(attrs.get("cn")) or "Unknown"
+                obj_classes = frozenset(
+                    str(cls).lower() for cls in attrs.get("objectClass", [])
                 )
 
-                results = []
-                for entry in conn.entries:
-                    cn = str(entry["cn"]) if "cn" in entry else "Unknown"
-                    obj_classes = [str(cls).lower() for cls in entry["objectClass"]]
-
-                    icon = self._get_object_icon(obj_classes)
-                    label = f"{icon} {cn}"
-
-                    results.append(
-                        {
-                            "label": label,
-                            "dn": entry.entry_dn,
-                            "cn": cn,
-                            "object_classes": obj_classes,
-                        }
-                    )
+                icon = self._get_object_icon(obj_classes)
+                label = f"{icon} {cn}"
 
-                return sorted(results, key=lambda x: x["cn"].lower())
+                results.append(
+                    {
+                        "label": label,
+                        "dn": entry["dn"],
+                        "cn": cn,
+                        "object_classes": obj_classes,
+                    }
+                )
 
-            return self.connection_manager.execute_with_retry(search_op)
+            return sorted(results, key=lambda x: x["cn"].lower())
         except Exception as e:
             raise Exception(f"Search failed: {e}")
 
@@ -183,7 +208,7 @@ class LDAPService:
 
             def move_op(conn: Connection):
                 # Extract the RDN
-                rdn = dn.split(",")[0]
+                rdn = split_dn(dn)[0]
 
                 # Perform the move
                 result = conn.modify_dn(dn, rdn, new_superior=target_ou)
@@ -237,33 +262,32 @@ class LDAPService:
             List of OU/container dictionaries
         """
         try:
+            # Include both OUs and containers (Builtin, Users, Computers, etc.)
+            ldap_filter = "(|(objectClass=organizationalUnit)(objectClass=container))"
+            if prefix:
+                # Let the server apply the prefix so the limit counts matches only
+                escaped = escape_filter_chars(prefix)
+                ldap_filter = f"(&{ldap_filter}(|(ou={escaped}*)(cn={escaped}*)))"
+            response = self.connection_manager.search_raw(
+                base_dn,
+                ldap_filter,
+                ["ou", "cn"],
+                search_scope="LEVEL",
+                size_limit=limit,
+            )
 
-            def search_ous_op(conn: Connection):
-                # Include both OUs and containers (Builtin, Users, Computers, etc.)
-                conn.search(
-                    base_dn,
-                    "(|(objectClass=organizationalUnit)(objectClass=container))",
-                    search_scope="LEVEL",
-                    attributes=["ou", "cn"],
-                    size_limit=limit,
-                )
-
-                ous = []
-                for entry in conn.entries:
-                    # Get name from ou (for OUs) or cn (for containers)
-                    if hasattr(entry, "ou") and entry.ou.value:
-                        name = str(entry.ou.value)
-                    elif hasattr(entry, "cn") and entry.cn.value:
-                        name = str(entry.cn.value)
-                    else:
-                        continue
-
-                    if not prefix or name.lower().startswith(prefix.lower()):
-                        ous.append({"name": name, "dn": entry.entry_dn})
+            ous = []
+            for entry in response:
+                attrs = entry["attributes"]
+                # Get name from ou (for OUs) or cn (for containers)
+                name = _first_value(attrs.get("ou")) or _first_value(attrs.get("cn"))
+                if not name:
+                    continue
 
-                return ous
+                if not prefix or name.lower().startswith(prefix.lower()):
+                    ous.append({"name": name, "dn": entry["dn"]})
 
-            return self.connection_manager.execute_with_retry(search_ous_op)
+            return ous
         except Exception as e:
             return []
 
@@ -290,9 +314,9 @@ class LDAPService:
                 for entry in conn.entries:
                     cn = str(entry.cn.value) if hasattr(entry, "cn") else "Unknown"
                     obj_classes = (
-                        [str(cls).lower() for cls in entry.objectClass]
+                        frozenset(str(cls).lower() for cls in entry.objectClass)
                         if hasattr(entry, "objectClass")
-                        else []
+                        else frozenset()
                     )
                     when_deleted = (
                         str(entry.whenChanged.value)
@@ -334,7 +358,7 @@ class LDAPService:
 
                 conn.search(
                     deleted_objects_dn,
-                    f"(&(isDeleted=TRUE)(cn={cn}*))",
+                    f"(&(isDeleted=TRUE)(cn={escape_filter_chars(cn)}*))",
                     search_scope="SUBTREE",
                     attributes=["*"],
                     controls=[(LDAPControl.SHOW_DELETED_OBJECTS, True, None)],
@@ -368,7 +392,9 @@ class LDAPService:
                 deleted_objects_dn = f"CN=Deleted Objects,{self.base_dn}"
 
                 # Build search filter - search by CN with wildcard
-                search_filter = f"(&(isDeleted=TRUE)(cn=*{query}*))"
+                search_filter = (
+                    f"(&(isDeleted=TRUE)(cn=*{escape_filter_chars(query)}*))"
+                )
 
                 conn.search(
                     deleted_objects_dn,
@@ -382,9 +408,9 @@ class LDAPService:
                 for entry in conn.entries:
                     cn = str(entry.cn.value) if hasattr(entry, "cn") else "Unknown"
                     obj_classes = (
-                        [str(cls).lower() for cls in entry.objectClass]
+                        frozenset(str(cls).lower() for cls in entry.objectClass)
                         if hasattr(entry, "objectClass")
-                        else []
+                        else frozenset()
                     )
                     when_deleted = (
                         str(entry.whenChanged.value)
@@ -573,25 +599,19 @@ class LDAPService:
         except Exception as e:
             return False, f"Error leaving group: {e}"
 
-    def _get_object_icon(self, object_classes: List[str]) -> str:
+    def _get_object_icon(self, object_classes: AbstractSet[str]) -> str:
         """Get icon for object based on object classes.
 
         Args:
-            object_classes: List of objectClass values
+            object_classes: Set of lowercased objectClass values
 
         Returns:
             Icon string
         """
-        if "user" in object_classes and "computer" not in object_classes:
-            return ObjectIcon.USER.value
-        elif "computer" in object_classes:
-            return ObjectIcon.COMPUTER.value
-        elif "group" in object_classes:
-            return ObjectIcon.GROUP.value
-        elif "organizationalunit" in object_classes:
-            return ObjectIcon.OU.value
-        else:
-            return ObjectIcon.GENERIC.value
+        for object_class, icon in _CLASS_ICONS:
+            if object_class in object_classes:
+                return icon
+        return ObjectIcon.GENERIC.value
 
     def unlock_user_account(self, user_dn: str) -> Tuple[bool, str]:
         """Unlock a locked user account.
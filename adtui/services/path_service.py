@@ -1,6 +1,73 @@
 """Path Service - Handles DN/path conversions."""
 
-from typing import List
+import re
+from functools import lru_cache
+from typing import Tuple
+
+from ldap3.core.exceptions import LDAPInvalidDnError
+from ldap3.utils.dn import parse_dn
+
+# A "+" that is not escaped, separating the attributes of a multi-valued RDN
+_RDN_ATTR_SEPARATOR = re.compile(r"(?<!\\)\+")
+
+
+@lru_cache(maxsize=512)
+def split_dn(dn: str) -> Tuple[str, str]:
+    """Split a DN into its RDN and parent DN.
+
+    Escaped commas (e.g. "cn=Doe\\, John") and the extra attributes of a
+    multi-valued RDN (e.g. "cn=a+sn=b") stay inside their RDN.
+
+    Args:
+        dn: Full Distinguished Name
+
+    Returns:
+        Tuple of (RDN, parent DN); the parent is "" for a single RDN
+    """
+    try:
+        parts = parse_dn(dn)
+    except LDAPInvalidDnError:
+        rdn, _, parent = dn.partition(",")
+        return rdn, parent
+    # Attributes of a multi-valued RDN (e.g. "cn=a+sn=b") are joined by "+"
+    rdns = []
+    current = []
+    for attr, value, separator in parts:
+        current.append(f"{attr}={value}")
+        if separator != "+":
+            rdns.append("+".join(current))
+            current = []
+    if current:
+        rdns.append("+".join(current))
+    return (rdns[0] if rdns else ""), ",".join(rdns[1:])
+
+
+@lru_cache(maxsize=512)
+def _path_to_dn(path: str, base_dn: str) -> str:
+    """Convert a path to a DN; see PathService.path_to_dn.
+
+    The result depends on nothing but the two strings, so it never has to
+    be invalidated.
+    """
+    # If it looks like a full DN already, return it
+    if "=" in path and ("ou=" in path.lower() or "cn=" in path.lower()):
+        return path
+
+    # Clean up the path
+    path = path.strip().strip("/")
+
+    if not path:
+        return base_dn
+
+    # Split by / and reverse to get DN order
+    parts = [p.strip() for p in path.split("/") if p.strip()]
+    parts.reverse()
+
+    # Build the DN
+    ou_parts = [f"ou={part}" for part in parts]
+
+    # Append base DN
+    return ",".join(ou_parts) + "," + base_dn
 
 
 class PathService:
@@ -61,27 +128,7 @@ class PathService:
             >>> path_service.path_to_dn("ou=IT,ou=Departments,dc=example,dc=com")
             "ou=IT,ou=Departments,dc=example,dc=com"
         """
-        # If it looks like a full DN already, return it
-        if "=" in path and ("ou=" in path.lower() or "cn=" in path.lower()):
-            return path
-
-        # Clean up the path
-        path = path.strip().strip("/")
-
-        if not path:
-            return self.base_dn
-
-        # Split by / and reverse to get DN order
-        parts = [p.strip() for p in path.split("/") if p.strip()]
-        parts.reverse()
-
-        # Build the DN
-        ou_parts = [f"ou={part}" for part in parts]
-
-        # Append base DN
-        full_dn = ",".join(ou_parts) + "," + self.base_dn
-
-        return full_dn
+        return _path_to_dn(path, self.base_dn)
 
     def get_parent_dn(self, dn: str) -> str:
         """Get the parent DN from a full DN.
@@ -96,10 +143,7 @@ class PathService:
             >>> path_service.get_parent_dn("cn=User,ou=IT,dc=example,dc=com")
             "ou=IT,dc=example,dc=com"
         """
-        parts = dn.split(",", 1)
-        if len(parts) > 1:
-            return parts[1]
-        return self.base_dn
+        return split_dn(dn)[1] or self.base_dn
 
     def get_rdn(self, dn: str) -> str:
         """Get the Relative Distinguished Name from a full DN.
@@ -114,7 +158,7 @@ class PathService:
             >>> path_service.get_rdn("cn=User,ou=IT,dc=example,dc=com")
             "cn=User"
         """
-        return dn.split(",")[0]
+        return split_dn(dn)[0]
 
     def extract_ou_name_from_path(self, path: str) -> str:
         """Extract the OU name from a path.
@@ -150,7 +194,9 @@ class PathService:
         """
         if not dn:
             return ""
-        first_part = dn.split(",")[0]
-        if "=" in first_part:
-            return first_part.split("=")[1]
-        return first_part
+        rdn = split_dn(dn)[0]
+        _, sep, value = rdn.partition("=")
+        if not sep:
+            return rdn
+        # Only the first attribute of a multi-valued RDN is the name
+        return _RDN_ATTR_SEPARATOR.split(value, 1)[0]
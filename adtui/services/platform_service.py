@@ -1,9 +1,11 @@
 """Platform Service - Cross-platform path and environment utilities."""
 
 import os
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 
 class PlatformService:
@@ -25,8 +27,9 @@ class PlatformService:
         return sys.platform.startswith("linux")
 
     @classmethod
+    @lru_cache(maxsize=1)
     def get_config_dir(cls) -> Path:
-        """Get the configuration directory path.
+        """Get the configuration directory path, resolved once per run.
 
         Returns:
             - Windows: %APPDATA%\\adtui
@@ -111,6 +114,7 @@ class PlatformService:
         return None
 
     @classmethod
+    @lru_cache(maxsize=4)
     def get_legacy_config_path(cls, filename: str = "config.ini") -> Optional[Path]:
         """Get legacy config path (Unix only).
 
@@ -120,3 +124,26 @@ class PlatformService:
         if cls.is_windows():
             return None
         return Path.home() / f".adtui_{filename}"
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_clipboard_command() -> Optional[List[str]]:
+        """Get the clipboard tool command, looked up once per run.
+
+        Returns:
+            - Windows: clip
+            - macOS: pbcopy
+            - Linux: wl-copy (Wayland), xclip (X11) or pbcopy, whichever is
+              installed first; None if none is
+        """
+        if sys.platform == "darwin":
+            candidates = [["pbcopy"]]
+        elif sys.platform == "win32":
+            candidates = [["clip"]]
+        else:
+            candidates = [["wl-copy"], ["xclip", "-selection", "clipboard"], ["pbcopy"]]
+        for command in candidates:
+            path = shutil.which(command[0])
+            if path:
+                return [path] + command[1:]
+        return None
@@ -1,13 +1,13 @@
 """Update service for checking and performing updates."""
 
+import asyncio
 import json
 import logging
 import subprocess
-import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import Optional, Tuple
 from urllib.request import urlopen, Request
 from urllib.error import URLError
 
@@ -145,6 +145,28 @@ class UpdateService:
         except Exception:
             return False
 
+    def get_cached_result(self, fresh_only: bool = True) -> Optional[UpdateCheckResult]:
+        """Get the result of the last update check without fetching.
+
+        Args:
+            fresh_only: If True, ignore a check older than UPDATE_CHECK_INTERVAL
+
+        Returns:
+            UpdateCheckResult from the cache, or None if there is no usable
+            check or it found no version
+        """
+        if fresh_only and self._should_check():
+            return None
+        cached_latest = self._load_cache().get("latest_version")
+        if not cached_latest:
+            return None
+        current = self._get_current_version()
+        return UpdateCheckResult(
+            current_version=current,
+            latest_version=cached_latest,
+            update_available=self._compare_versions(current, cached_latest),
+        )
+
     def check_for_update(self, force: bool = False) -> UpdateCheckResult:
         """Check for updates.
 
@@ -154,18 +176,13 @@ class UpdateService:
         Returns:
             UpdateCheckResult with version information
         """
-        current = self._get_current_version()
-
         # Return cached result if recent enough
-        if not force and not self._should_check():
-            cache = self._load_cache()
-            cached_latest = cache.get("latest_version")
-            if cached_latest:
-                return UpdateCheckResult(
-                    current_version=current,
-                    latest_version=cached_latest,
-                    update_available=self._compare_versions(current, cached_latest),
-                )
+        if not force:
+            cached = self.get_cached_result()
+            if cached is not None:
+                return cached
+
+        current = self._get_current_version()
 
         # Fetch latest version
         latest = self._fetch_latest_version()
@@ -191,27 +208,17 @@ class UpdateService:
             update_available=self._compare_versions(current, latest),
         )
 
-    def check_for_update_async(
-        self, callback: Callable[[UpdateCheckResult], None]
-    ) -> threading.Thread:
-        """Check for updates in background thread.
+    async def check_for_update_async(self, force: bool = False) -> UpdateCheckResult:
+        """Check for updates without blocking the event loop.
 
         Args:
-            callback: Function to call with result
+            force: If True, ignore cache and check anyway
 
         Returns:
-            The background thread
+            UpdateCheckResult with version information
         """
-        def _check():
-            try:
-                result = self.check_for_update()
-                callback(result)
-            except Exception as e:
-                logger.debug(f"Async update check failed: {e}")
-
-        thread = threading.Thread(target=_check, daemon=True)
-        thread.start()
-        return thread
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.check_for_update, force)
 
     def perform_update(self) -> Tuple[bool, str]:
         """Perform the actual update.
@@ -1,7 +1,7 @@
 """Modal dialogs for ADTUI."""
 
 import logging
-from typing import Dict, Optional, Tuple, List, Any
+from typing import Dict
 
 from ldap3 import Connection
 
@@ -24,9 +24,13 @@ from textual.widgets import (
     ListItem,
     Label,
     Checkbox,
-    TextArea,
 )
 
+try:
+    from ..widgets.user_details import UserDetailsPane
+except ImportError:
+    from widgets.user_details import UserDetailsPane
+
 logger = logging.getLogger(__name__)
 
 
@@ -322,6 +326,7 @@ class EditUserDialog(ModalScreen):
 
                 if self.connection_manager:
                     self.connection_manager.execute_with_retry(update_user_op)
+                    self.app.forget_details(self.dn)
 
                 self.app.notify("User updated successfully", severity="information")
                 self.dismiss(True)
@@ -374,13 +379,20 @@ class ManageGroupsDialog(ModalScreen):
     def on_mount(self) -> None:
         """Populate the groups list after mounting."""
         groups_list = self.query_one("#groups-list", ListView)
-        if self.user_details and self.user_details.member_of:
-            for group in self.user_details.member_of:
-                item = ListItem(Label(group["name"]))
-                self.groups_data[id(item)] = group
-                groups_list.append(item)
+        self._show_memberships(groups_list)
         groups_list.focus()
 
+    def _show_memberships(self, groups_list: ListView) -> None:
+        """Add the user's current groups to the list in one mount."""
+        if not (self.user_details and self.user_details.member_of):
+            return
+        items = []
+        for group in self.user_details.member_of:
+            item = ListItem(Label(group["name"]))
+            self.groups_data[id(item)] = group
+            items.append(item)
+        groups_list.extend(items)
+
     def action_dismiss_dialog(self) -> None:
         self.dismiss()
 
@@ -389,12 +401,7 @@ class ManageGroupsDialog(ModalScreen):
         groups_list = self.query_one("#groups-list", ListView)
         groups_list.clear()
         self.groups_data.clear()
-
-        if self.user_details and self.user_details.member_of:
-            for group in self.user_details.member_of:
-                item = ListItem(Label(group["name"]))
-                self.groups_data[id(item)] = group
-                groups_list.append(item)
+        self._show_memberships(groups_list)
 
         # Update the header with current count
         header = self.query_one("#question", Static)
@@ -411,8 +418,6 @@ class ManageGroupsDialog(ModalScreen):
         """Update user_details after LDAP operations."""
         try:
             # Re-fetch user details to get current group memberships
-            from widgets.user_details import UserDetailsPane
-
             temp_user_details = UserDetailsPane()
             temp_user_details.update_user_details(self.dn, self.connection_manager)
             self.user_details = temp_user_details
@@ -439,6 +444,7 @@ class ManageGroupsDialog(ModalScreen):
                 conn.modify(group_data["dn"], {"member": [(MODIFY_DELETE, [self.dn])]})
 
             self.connection_manager.execute_with_retry(remove_group_op)
+            self.app.forget_details(self.dn, group_data["dn"])
             self.app.notify(
                 f"Removed from {group_data['name']}", severity="information"
             )
@@ -467,11 +473,7 @@ class ManageGroupsDialog(ModalScreen):
                 groups_list = self.query_one("#groups-list", ListView)
                 groups_list.clear()
                 # Repopulate with current memberships
-                if self.user_details and self.user_details.member_of:
-                    for group in self.user_details.member_of:
-                        item = ListItem(Label(group["name"]))
-                        self.groups_data[id(item)] = group
-                        groups_list.append(item)
+                self._show_memberships(groups_list)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in search input."""
@@ -520,6 +522,7 @@ class ManageGroupsDialog(ModalScreen):
             self.groups_data.clear()
 
             if entries:
+                items = []
                 for entry in entries:
                     group_name = str(entry.cn.value)
                     group_dn = entry.entry_dn
@@ -538,7 +541,8 @@ class ManageGroupsDialog(ModalScreen):
                         "dn": group_dn,
                         "is_member": is_member,
                     }
-                    groups_list.append(item)
+                    items.append(item)
+                groups_list.extend(items)
 
                 self.app.notify(f"Found {len(entries)} groups", severity="information")
             else:
@@ -582,6 +586,7 @@ class ManageGroupsDialog(ModalScreen):
                 conn.modify(group_data["dn"], {"member": [(MODIFY_ADD, [self.dn])]})
 
             self.connection_manager.execute_with_retry(add_to_group_op)
+            self.app.forget_details(self.dn, group_data["dn"])
             self.app.notify(f"Added to {group_data['name']}", severity="information")
 
             # Update user details and refresh list
@@ -632,8 +637,9 @@ class ManageGroupMembersDialog(ModalScreen):
         """Populate the members list after mounting."""
         members_list = self.query_one("#members-list", ListView)
         if self.group_details and self.group_details.members:
-            for member in self.group_details.members:
-                members_list.append(ListItem(Label(member["name"])))
+            members_list.extend(
+                ListItem(Label(member["name"])) for member in self.group_details.members
+            )
         members_list.focus()
 
     def action_dismiss_dialog(self) -> None:
@@ -680,8 +686,11 @@ class EditAttributesDialog(ModalScreen):
                 entry = entries[0]
                 attrs_list = self.query_one("#attributes-list", ListView)
 
-                for attr in sorted(entry.entry_attributes_as_dict.keys()):
-                    values = entry.entry_attributes_as_dict[attr]
+                items = []
+                # entry_attributes_as_dict builds a new dict on every access
+                attributes = entry.entry_attributes_as_dict
+                for attr in sorted(attributes):
+                    values = attributes[attr]
                     if isinstance(values, list):
                         value_str = ", ".join(str(v) for v in values[:3])
                         if len(values) > 3:
@@ -696,7 +705,8 @@ class EditAttributesDialog(ModalScreen):
                     label = f"[bold]{attr}:[/bold] {value_str}"
                     item = ListItem(Label(label))
                     self.attributes[id(item)] = {"name": attr, "values": values}
-                    attrs_list.append(item)
+                    items.append(item)
+                attrs_list.extend(items)
 
                 attrs_list.focus()
         except Exception as e:
@@ -782,6 +792,7 @@ class EditSingleAttributeDialog(ModalScreen):
                         )
 
                     self.connection_manager.execute_with_retry(update_attr_op)
+                    self.app.forget_details(self.dn)
                     self.app.notify(f"Updated {self.attr_name}", severity="information")
                     self.dismiss(True)
                 else:
@@ -791,6 +802,7 @@ class EditSingleAttributeDialog(ModalScreen):
                         conn.modify(self.dn, {self.attr_name: [(MODIFY_DELETE, [])]})
 
                     self.connection_manager.execute_with_retry(delete_attr_op)
+                    self.app.forget_details(self.dn)
                     self.app.notify(f"Deleted {self.attr_name}", severity="information")
                     self.dismiss(True)
             except Exception as e:
@@ -947,6 +959,7 @@ class SetPasswordDialog(ModalScreen):
                     result = conn.extend.microsoft.modify_password(self.dn, pwd1)
 
                     if result and conn.result["result"] == 0:
+                        self.app.forget_details(self.dn)
                         self.app.notify(
                             "Password updated successfully", severity="information"
                         )
@@ -1388,6 +1401,7 @@ class ADSelectionDialog(ModalScreen[str]):
         """Populate the domains list after mounting."""
         domains_list = self.query_one("#domains-list", ListView)
 
+        items = []
         for domain, config in self.ad_configs.items():
             label = f"[bold]{domain}[/bold] - {config.server}"
             if config.use_ssl:
@@ -1397,7 +1411,8 @@ class ADSelectionDialog(ModalScreen[str]):
 
             item = ListItem(Label(label))
             self.domain_data[id(item)] = domain
-            domains_list.append(item)
+            items.append(item)
+        domains_list.extend(items)
 
         domains_list.focus()
 
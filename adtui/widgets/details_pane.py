@@ -1,7 +1,6 @@
 """Details pane widget for displaying AD object information."""
 
 import logging
-from typing import Optional, Any
 
 from textual.binding import Binding
 
@@ -142,7 +141,10 @@ class DetailsPane(SelectableStatic):
                 state = connection_manager.get_state()
 
             self.user_details = UserDetailsPane()
-            self.user_details.update_user_details(dn, connection_manager)
+            self.user_details.update_user_details(
+                dn, connection_manager, self.app.get_cached_details(dn)
+            )
+            self._remember(dn, self.user_details.entry)
 
             # Get the content
             content = self.user_details._build_content()
@@ -160,7 +162,10 @@ class DetailsPane(SelectableStatic):
         """Display group details."""
         try:
             self.group_details = GroupDetailsPane()
-            self.group_details.update_group_details(dn, connection_manager)
+            self.group_details.update_group_details(
+                dn, connection_manager, self.app.get_cached_details(dn)
+            )
+            self._remember(dn, self.group_details.entry)
 
             content = self.group_details._build_content()
             self.update(content)
@@ -180,9 +185,8 @@ class DetailsPane(SelectableStatic):
                 conn.search(dn, "(objectClass=*)", attributes=["*"])
                 return conn.entries
 
-            entries = connection_manager.execute_with_retry(search_computer_op)
-            if entries:
-                entry = entries[0]
+            entry = self._fetch_entry(dn, connection_manager, search_computer_op)
+            if entry is not None:
 
                 cn = str(entry.cn.value) if hasattr(entry, "cn") else "N/A"
                 os_name = (
@@ -228,9 +232,8 @@ DN: {dn}
                 )
                 return conn.entries
 
-            entries = connection_manager.execute_with_retry(search_ou_op)
-            if entries:
-                entry = entries[0]
+            entry = self._fetch_entry(dn, connection_manager, search_ou_op)
+            if entry is not None:
 
                 ou_name = str(entry.ou.value) if hasattr(entry, "ou") else "N/A"
                 description = (
@@ -283,13 +286,27 @@ Last Modified: {when_changed}
         except Exception as e:
             self.update(f"Details for: {label}\n\n[red]Error: {e}[/red]")
 
+    def _fetch_entry(self, dn, connection_manager, search_op):
+        """Get an object's entry from the app's cache or by running search_op."""
+        entry = self.app.get_cached_details(dn)
+        if entry is None:
+            entries = connection_manager.execute_with_retry(search_op)
+            entry = entries[0] if entries else None
+            self._remember(dn, entry)
+        return entry
+
+    def _remember(self, dn, entry):
+        """Keep a fetched entry so revisiting the object skips the search."""
+        if entry is not None:
+            self.app.remember_details(dn, entry)
+
     def refresh_details(self):
         """Refresh the current details view."""
+        if self.current_dn:
+            self.app.forget_details(self.current_dn)
         if self.current_type == "user" and self.user_details:
-            self.user_details.load_user_details()
             self._show_user_details(self.current_dn, self.current_connection_manager)
         elif self.current_type == "group" and self.group_details:
-            self.group_details.load_group_details()
             self._show_group_details(self.current_dn, self.current_connection_manager)
         elif self.current_type == "ou":
             self._show_ou_details(
@@ -1,7 +1,6 @@
 """Group details pane widget for displaying AD group information."""
 
 import logging
-from typing import Optional, List, Any
 
 from textual.widgets import Static
 from ldap3 import MODIFY_ADD, MODIFY_DELETE
@@ -18,12 +17,21 @@ class GroupDetailsPane(Static):
         self.members = []
         self.member_of = []
 
-    def update_group_details(self, group_dn, connection_manager):
-        """Load and display group details."""
+    def update_group_details(self, group_dn, connection_manager, entry=None):
+        """Load and display group details.
+
+        Args:
+            group_dn: DN of the group
+            connection_manager: Connection manager used for LDAP operations
+            entry: Already fetched entry of the group, searched for if None
+        """
 
         self.group_dn = group_dn
         self.connection_manager = connection_manager
-        self.load_group_details()
+        if entry is None:
+            self.load_group_details()
+        else:
+            self._set_entry(entry)
 
     def load_group_details(self):
         """Fetch group members and memberOf from LDAP."""
@@ -42,30 +50,34 @@ class GroupDetailsPane(Static):
             entries = self.connection_manager.execute_with_retry(search_group_op)
 
             if entries:
-                self.entry = entries[0]
-
-                # Extract members (just the CN)
-                if hasattr(self.entry, "member") and self.entry.member:
-                    self.members = [
-                        {"name": dn.split(",")[0].split("=")[1], "dn": dn}
-                        for dn in self.entry.member.values
-                    ]
-                else:
-                    self.members = []
-
-                # Extract memberOf groups (just the CN)
-                if hasattr(self.entry, "memberOf") and self.entry.memberOf:
-                    self.member_of = [
-                        {"name": dn.split(",")[0].split("=")[1], "dn": dn}
-                        for dn in self.entry.memberOf.values
-                    ]
-                else:
-                    self.member_of = []
+                self._set_entry(entries[0])
         except Exception as e:
             import traceback
 
             traceback.print_exc()
 
+    def _set_entry(self, entry) -> None:
+        """Store a fetched group entry and the members derived from it."""
+        self.entry = entry
+
+        # Extract members (just the CN)
+        if hasattr(self.entry, "member") and self.entry.member:
+            self.members = [
+                {"name": dn.split(",")[0].split("=")[1], "dn": dn}
+                for dn in self.entry.member.values
+            ]
+        else:
+            self.members = []
+
+        # Extract memberOf groups (just the CN)
+        if hasattr(self.entry, "memberOf") and self.entry.memberOf:
+            self.member_of = [
+                {"name": dn.split(",")[0].split("=")[1], "dn": dn}
+                for dn in self.entry.memberOf.values
+            ]
+        else:
+            self.member_of = []
+
     def refresh_display(self):
         """Refresh the displayed content."""
         if not self.entry:
@@ -144,6 +156,7 @@ DN: {self.group_dn}
             result = self.connection_manager.execute_with_retry(add_member_op)
             if result["result"] == 0:
                 logger.info("Successfully added member to group %s", self.group_dn)
+                self.app.forget_details(self.group_dn, member_dn)
                 self.load_group_details()
                 return True
             else:
@@ -167,6 +180,7 @@ DN: {self.group_dn}
             result = self.connection_manager.execute_with_retry(remove_member_op)
             if result["result"] == 0:
                 logger.info("Successfully removed member from group %s", self.group_dn)
+                self.app.forget_details(self.group_dn, member_dn)
                 self.load_group_details()
                 return True
             else:
@@ -192,6 +206,7 @@ DN: {self.group_dn}
             result = self.connection_manager.execute_with_retry(join_group_op)
             if result["result"] == 0:
                 logger.info("Successfully joined group %s", parent_group_dn)
+                self.app.forget_details(self.group_dn, parent_group_dn)
                 self.load_group_details()
                 return True
             else:
@@ -217,6 +232,7 @@ DN: {self.group_dn}
             result = self.connection_manager.execute_with_retry(leave_group_op)
             if result["result"] == 0:
                 logger.info("Successfully left group %s", parent_group_dn)
+                self.app.forget_details(self.group_dn, parent_group_dn)
                 self.load_group_details()
                 return True
             else:
@@ -3,15 +3,23 @@
 import logging
 import re
 import subprocess
-import sys
 from typing import Optional, List, Tuple
 
 from textual.widgets import Static
 from textual.events import MouseDown, MouseUp, MouseMove
 from rich.text import Text
 
+try:
+    from ..services.platform_service import PlatformService
+except ImportError:
+    from services.platform_service import PlatformService
+
 logger = logging.getLogger(__name__)
 
+# Rich markup tags and ANSI escape sequences stripped from the selectable text
+_MARKUP_TAG = re.compile(r'\[/?[^\]]+\]')
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 
 class SelectableStatic(Static):
     """Static widget with mouse text selection and automatic clipboard copy."""
@@ -43,13 +51,12 @@ class SelectableStatic(Static):
                 plain = renderable.plain
             elif isinstance(renderable, str):
                 # Strip Rich markup tags
-                plain = re.sub(r'\[/?[^\]]+\]', '', renderable)
+                plain = _MARKUP_TAG.sub('', renderable)
             else:
                 plain = str(renderable)
 
             # Strip ANSI escape codes
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            plain = ansi_escape.sub('', plain)
+            plain = _ANSI_ESCAPE.sub('', plain)
 
             return plain.split('\n')
         except Exception as e:
@@ -145,8 +152,7 @@ class SelectableStatic(Static):
         """Copy text to system clipboard with cross-platform support."""
         try:
             # Strip ANSI escape codes
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            clean_text = ansi_escape.sub('', text)
+            clean_text = _ANSI_ESCAPE.sub('', text)
 
             # Remove excessive whitespace but keep newlines
             clean_text = '\n'.join(
@@ -156,43 +162,20 @@ class SelectableStatic(Static):
             if not clean_text:
                 return
 
-            # Try different clipboard commands based on OS
-            if sys.platform == 'linux':
-                # Try wl-copy first (Wayland), then xclip (X11)
-                for cmd in ['wl-copy', 'xclip -selection clipboard']:
-                    try:
-                        subprocess.run(
-                            cmd,
-                            input=clean_text,
-                            text=True,
-                            check=True,
-                            shell=True,
-                            capture_output=True,
-                        )
-                        self._notify_copy_success(clean_text)
-                        return
-                    except (subprocess.CalledProcessError, FileNotFoundError):
-                        continue
-                # Fallback to pbcopy if available
-                try:
-                    subprocess.run(['pbcopy'], input=clean_text, text=True, check=True)
-                    self._notify_copy_success(clean_text)
-                    return
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    pass
-            elif sys.platform == 'darwin':
-                subprocess.run(['pbcopy'], input=clean_text, text=True, check=True)
-                self._notify_copy_success(clean_text)
-                return
-            elif sys.platform == 'win32':
-                subprocess.run(
-                    ['clip'], input=clean_text, text=True, check=True, shell=True
-                )
-                self._notify_copy_success(clean_text)
+            command = PlatformService.get_clipboard_command()
+            if command is None:
+                # Clipboard not available
+                logger.debug("Clipboard not available")
                 return
 
-            # Clipboard not available
-            logger.debug("Clipboard not available")
+            subprocess.run(
+                command,
+                input=clean_text,
+                text=True,
+                check=True,
+                capture_output=True,
+            )
+            self._notify_copy_success(clean_text)
 
         except Exception as e:
             logger.debug(f"Failed to copy to clipboard: {e}")
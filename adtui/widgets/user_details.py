@@ -4,14 +4,14 @@ import logging
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, Any
+from typing import Tuple, Any
 
 from textual.widgets import Static
 from ldap3 import MODIFY_REPLACE, MODIFY_ADD, MODIFY_DELETE
 
 # Add parent directory to path to import constants
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from constants import PasswordPolicy, UserAccountControl
+from constants import AccountPolicy, PasswordPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +26,22 @@ class UserDetailsPane(Static):
         self.raw_attributes = {}
         self.load_error = None
 
-    def update_user_details(self, user_dn, connection_manager):
-        """Load and display user details."""
+    def update_user_details(self, user_dn, connection_manager, entry=None):
+        """Load and display user details.
+
+        Args:
+            user_dn: DN of the user
+            connection_manager: Connection manager used for LDAP operations
+            entry: Already fetched entry of the user, searched for if None
+        """
 
         self.user_dn = user_dn
         self.connection_manager = connection_manager
         self.load_error = None  # Clear any previous error
-        self.load_user_details()
+        if entry is None:
+            self.load_user_details()
+        else:
+            self._set_entry(entry)
 
         if not self.entry:
             logger.debug("No entry found after load_user_details for %s", user_dn)
@@ -54,35 +63,7 @@ class UserDetailsPane(Static):
             entries = self.connection_manager.execute_with_retry(search_user_op)
 
             if entries:
-                self.entry = entries[0]
-
-                # Extract member of groups (just the CN)
-                if hasattr(self.entry, "memberOf") and self.entry.memberOf:
-                    self.member_of = [
-                        {"name": dn.split(",")[0].split("=")[1], "dn": dn}
-                        for dn in self.entry.memberOf.values
-                    ]
-                else:
-                    self.member_of = []
-
-                # Store raw attributes
-                if hasattr(self.entry, "entry_attributes"):
-                    try:
-                        # Safely convert entry_attributes to dict
-                        if hasattr(self.entry.entry_attributes, "items"):
-                            # If it's already dict-like
-                            self.raw_attributes = dict(
-                                self.entry.entry_attributes.items()
-                            )
-                        else:
-                            # Try direct conversion, handle potential errors
-                            self.raw_attributes = {}
-                            for attr, values in self.entry.entry_attributes:
-                                self.raw_attributes[attr] = values
-                    except Exception as e:
-                        # Not critical - raw attributes are only used for the attributes dialog
-                        logger.debug("Failed to convert entry_attributes: %s", e)
-                        self.raw_attributes = {}
+                self._set_entry(entries[0])
             else:
                 logger.debug("No entries found in search results for %s", self.user_dn)
                 self.entry = None
@@ -102,6 +83,22 @@ class UserDetailsPane(Static):
                 logger.debug("Re-raising authentication error for proper handling")
                 raise  # Re-raise to allow connection manager to handle it
 
+    def _set_entry(self, entry) -> None:
+        """Store a fetched user entry and the values derived from it."""
+        self.entry = entry
+
+        # Extract member of groups (just the CN)
+        if hasattr(self.entry, "memberOf") and self.entry.memberOf:
+            self.member_of = [
+                {"name": dn.split(",")[0].split("=")[1], "dn": dn}
+                for dn in self.entry.memberOf.values
+            ]
+        else:
+            self.member_of = []
+
+        # Store raw attributes (entry_attributes only holds the names)
+        self.raw_attributes = self.entry.entry_attributes_as_dict
+
     def refresh_display(self):
         """Refresh the displayed content."""
         if not self.entry:
@@ -370,8 +367,8 @@ class UserDetailsPane(Static):
         if hasattr(self.entry, "accountExpires") and self.entry.accountExpires.value:
             try:
                 account_expires_filetime = int(self.entry.accountExpires.value)
-                # 0 or 9223372036854775807 (0x7FFFFFFFFFFFFFFF) means never expires
-                if account_expires_filetime not in [0, 9223372036854775807]:
+                # 0 or 0x7FFFFFFFFFFFFFFF means never expires
+                if account_expires_filetime not in AccountPolicy.NEVER_EXPIRES_VALUES:
                     account_expires_dt = datetime(1601, 1, 1) + timedelta(
                         microseconds=account_expires_filetime / 10
                     )
@@ -458,6 +455,7 @@ Password Last Set: {pwd_last_set}{" - " + pwd_expiry_info if pwd_expiry_info and
                     attribute,
                     self.user_dn,
                 )
+                self.app.forget_details(self.user_dn)
                 self.load_user_details()
                 return True
             else:
@@ -483,6 +481,7 @@ Password Last Set: {pwd_last_set}{" - " + pwd_expiry_info if pwd_expiry_info and
                 logger.info(
                     "Successfully added user %s to group %s", self.user_dn, group_dn
                 )
+                self.app.forget_details(self.user_dn, group_dn)
                 self.load_user_details()
                 return True
             else:
@@ -508,6 +507,7 @@ Password Last Set: {pwd_last_set}{" - " + pwd_expiry_info if pwd_expiry_info and
                 logger.info(
                     "Successfully removed user %s from group %s", self.user_dn, group_dn
                 )
+                self.app.forget_details(self.user_dn, group_dn)
                 self.load_user_details()
                 return True
             else:
@@ -525,6 +525,7 @@ Password Last Set: {pwd_last_set}{" - " + pwd_expiry_info if pwd_expiry_info and
         try:
             success, message = self._unlock_account_via_service()
             if success:
+                self.app.forget_details(self.user_dn)
                 self.load_user_details()  # Refresh the display
             return success
         except Exception as e:
@@ -578,6 +579,7 @@ Password Last Set: {pwd_last_set}{" - " + pwd_expiry_info if pwd_expiry_info and
         try:
             success, message = self._enable_account_via_service()
             if success:
+                self.app.forget_details(self.user_dn)
                 self.load_user_details()  # Refresh the display
             return success
         except Exception as e:
@@ -619,6 +621,7 @@ Password Last Set: {pwd_last_set}{" - " + pwd_expiry_info if pwd_expiry_info and
         try:
             success, message = self._disable_account_via_service()
             if success:
+                self.app.forget_details(self.user_dn)
                 self.load_user_details()  # Refresh the display
             return success
         except Exception as e:
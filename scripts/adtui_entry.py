@@ -0,0 +1,11 @@
+"""PyInstaller entry script for ADTUI.
+
+adtui/adtui.py and adtui/__main__.py use package-relative imports, which
+fail when PyInstaller runs them as a top-level script, so the executable
+starts here and imports the package by name.
+"""
+
+from adtui.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ ROOT_DIR = os.path.abspath('.')
 block_cipher = None
 
 a = Analysis(
-    ['adtui/adtui.py'],
+    [os.path.join(ROOT_DIR, 'scripts', 'adtui_entry.py')],
     pathex=[ROOT_DIR],
     binaries=[],
     datas=[